@@ -104,6 +104,17 @@ def get_inventory_fields() -> List[Dict[str, Any]]:
     """Get field configuration for current inventory type."""
     return INVENTORY_SCHEMAS.get(INVENTORY_TYPE, INVENTORY_SCHEMAS[InventoryType.WAREHOUSE])
 
+# Field name -> field config, built once per inventory type
+_FIELD_MAPS: Dict[InventoryType, Dict[str, Dict[str, Any]]] = {}
+
+def get_field_map() -> Dict[str, Dict[str, Any]]:
+    """Get field configs keyed by field name for current inventory type."""
+    field_map = _FIELD_MAPS.get(INVENTORY_TYPE)
+    if field_map is None:
+        field_map = {field["name"]: field for field in get_inventory_fields()}
+        _FIELD_MAPS[INVENTORY_TYPE] = field_map
+    return field_map
+
 def get_table_name() -> str:
     """Get table name for current inventory type."""
     return f"{INVENTORY_TYPE.value}_inventory"
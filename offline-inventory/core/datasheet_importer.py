@@ -103,14 +103,12 @@ def parse_csv(path: Path) -> List[Tuple[str, Dict[str, Any]]]:
         - 'rows': list of lists (each inner list is a row)
     """
     try:
-        # Read sample to detect delimiter
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        # Read sample to detect delimiter, then parse the full file from the
+        # same handle so it is only opened once
+        with open(path, 'r', encoding='utf-8', errors='ignore', newline='') as f:
             sample = f.read(1024)
             delimiter = detect_delimiter(sample)
-        
-        # Read the full file
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            # Try to detect if first line is header
+            f.seek(0)
             reader = csv.reader(f, delimiter=delimiter)
             rows = list(reader)
         
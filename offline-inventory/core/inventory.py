@@ -10,12 +10,31 @@ Version: 2.0.0
 """
 
 import json
+import re
 import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Set, Tuple
 from decimal import Decimal
 
-from core.config import get_inventory_fields, INVENTORY_TYPE
+from core.config import get_inventory_fields, get_field_map, INVENTORY_TYPE
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse a stored ISO timestamp, falling back to the current time."""
+    if value and isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return datetime.now()
+    return value or datetime.now()
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps hook: store Decimal values as floats, like to_dict()."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
 class Item:
@@ -30,23 +49,8 @@ class Item:
         self.id = kwargs.pop('id', str(uuid.uuid4())[:8])
         
         # Use provided timestamps if available (for loading from database), otherwise use current time
-        created_at = kwargs.pop('created_at', None)
-        if created_at and isinstance(created_at, str):
-            try:
-                self.created_at = datetime.fromisoformat(created_at)
-            except ValueError:
-                self.created_at = datetime.now()
-        else:
-            self.created_at = created_at or datetime.now()
-            
-        updated_at = kwargs.pop('updated_at', None)
-        if updated_at and isinstance(updated_at, str):
-            try:
-                self.updated_at = datetime.fromisoformat(updated_at)
-            except ValueError:
-                self.updated_at = datetime.now()
-        else:
-            self.updated_at = updated_at or datetime.now()
+        self.created_at = _parse_timestamp(kwargs.pop('created_at', None))
+        self.updated_at = _parse_timestamp(kwargs.pop('updated_at', None))
         
         # Get current inventory configuration
         fields = get_inventory_fields()
@@ -86,6 +90,64 @@ class Item:
         if not from_database:
             self._validate()
     
+    @classmethod
+    def from_row(cls, row: Dict[str, Any], fields: Optional[List[Dict[str, Any]]] = None) -> "Item":
+        """
+        Build an item from a stored database row.
+        
+        Equivalent to Item(**row) for rows that carry id/created_at, but skips
+        keyword unpacking and validation (stored rows were validated when they
+        were saved). Use row_loader() when building many items.
+        """
+        return cls.row_loader(fields)(row)
+    
+    @classmethod
+    def row_loader(cls, fields: Optional[List[Dict[str, Any]]] = None):
+        """
+        Return a function that builds items from stored rows.
+        
+        The field config is flattened once, so each row only pays for its
+        value conversions and a single instance __dict__ update.
+        """
+        if fields is None:
+            fields = get_inventory_fields()
+        
+        plan = []
+        for field_config in fields:
+            field_type = field_config["type"]
+            if field_config["required"]:
+                # Sensible defaults for required fields missing from stored rows
+                missing = 0 if field_type == "INTEGER" else 0.0 if field_type == "REAL" else ""
+            else:
+                missing = field_config.get("default", None)
+            plan.append((field_config["name"], field_type, missing))
+        
+        new = object.__new__
+        
+        def load(row: Dict[str, Any]) -> "Item":
+            data = {}
+            for field_name, field_type, missing in plan:
+                if field_name in row:
+                    value = row[field_name]
+                    if field_type == "INTEGER" and isinstance(value, str):
+                        value = int(value) if value.isdigit() else 0
+                    elif field_type == "REAL" and not isinstance(value, Decimal):
+                        value = Decimal(str(value))
+                    data[field_name] = value
+                else:
+                    data[field_name] = missing
+            
+            item = new(cls)
+            item.__dict__.update(
+                data=data,
+                id=row.get('id') or str(uuid.uuid4())[:8],
+                created_at=_parse_timestamp(row.get('created_at')),
+                updated_at=_parse_timestamp(row.get('updated_at')),
+            )
+            return item
+        
+        return load
+    
     def __getattr__(self, name):
         """Allow accessing data fields as attributes."""
         if name in self.data:
@@ -96,7 +158,7 @@ class Item:
         """Allow setting data fields as attributes."""
         if name in ['id', 'created_at', 'updated_at', 'data']:
             super().__setattr__(name, value)
-        elif hasattr(self, 'data') and name in [field["name"] for field in get_inventory_fields()]:
+        elif hasattr(self, 'data') and name in get_field_map():
             self.data[name] = value
             self.updated_at = datetime.now()
         else:
@@ -118,8 +180,7 @@ class Item:
     
     def update_field(self, field_name: str, new_value: Any):
         """Update a specific field with validation."""
-        fields = get_inventory_fields()
-        field_config = next((f for f in fields if f["name"] == field_name), None)
+        field_config = get_field_map().get(field_name)
         
         if not field_config:
             raise ValueError(f"Field '{field_name}' is not configured for this inventory type")
@@ -160,26 +221,133 @@ class Item:
         
         return result
     
+    def to_row(self) -> tuple:
+        """
+        Serialize the item straight to an items-table row.
+        
+        Returns (id, created_at, updated_at, data_json) with the same JSON
+        that json.dumps(self.to_dict()) produces, but Decimal values are
+        converted by the JSON encoder instead of a Python loop over fields.
+        """
+        created_at = self.created_at.isoformat()
+        updated_at = self.updated_at.isoformat()
+        payload = {'id': self.id, 'created_at': created_at, 'updated_at': updated_at}
+        payload.update(self.data)
+        return (self.id, created_at, updated_at, json.dumps(payload, default=_json_default))
+    
     def __repr__(self):
         name = self.data.get("name", "Unknown Item")
         return f"{name} (ID: {self.id})"
 
 
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _item_text(item: Item) -> str:
+    """
+    Lowercased text fields of an item joined into one string.
+    
+    Fields are separated by NUL, which never appears in a typed query, so a
+    substring test on the joined text matches exactly when some single
+    field matches.
+    """
+    return "\0".join(value for value in item.data.values() if isinstance(value, str)).lower()
+
+
+SEARCH_CACHE_SIZE = 128
+
+
 class Inventory:
     """Flexible inventory management system."""
     
     def __init__(self):
         self.items: Dict[str, Item] = {}  # id -> Item mapping
+        # Inverted search index: token -> ids of items containing it, plus
+        # the tokens indexed for each item so removal is cheap
+        self._token_index: Dict[str, Set[str]] = {}
+        self._indexed_tokens: Dict[str, Set[str]] = {}
+        # Searchable text per item (see _item_text), kept in one flat dict so
+        # substring checks scan a single string per item
+        self._search_text: Dict[str, str] = {}
+        # Recent search results (query -> items), cleared on any change
+        self._search_cache: "OrderedDict[str, List[Item]]" = OrderedDict()
+        # Tuple of all items for get_all_items(), rebuilt after adds/removes
+        self._all_items: Optional[Tuple[Item, ...]] = None
+        # Bumped on every change, so callers can tell a cached view is stale
+        self.version = 0
+    
+    def _index_item(self, item: Item):
+        """Add an item's text and tokens to the search index."""
+        text = _item_text(item)
+        tokens = set(_TOKEN_RE.findall(text))
+        self._search_text[item.id] = text
+        self._indexed_tokens[item.id] = tokens
+        for token in tokens:
+            self._token_index.setdefault(token, set()).add(item.id)
+    
+    def _unindex_item(self, item_id: str):
+        """Drop an item's text and tokens from the search index."""
+        self._search_text.pop(item_id, None)
+        for token in self._indexed_tokens.pop(item_id, ()):
+            ids = self._token_index.get(token)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del self._token_index[token]
     
     def add_item(self, item: Item) -> bool:
         """Add item to inventory."""
+        if item.id in self.items:
+            self._unindex_item(item.id)
         self.items[item.id] = item
+        self._index_item(item)
+        self._search_cache.clear()
+        self._all_items = None
+        self.version += 1
         return True
     
+    def bulk_add(self, items) -> int:
+        """Add many items in one dict update; returns the number added."""
+        items = list(items)
+        before = len(self.items)
+        for item in items:
+            if item.id in self.items:
+                self._unindex_item(item.id)
+        self.items.update((item.id, item) for item in items)
+        self._search_cache.clear()
+        self._all_items = None
+        self.version += 1
+        for item in items:
+            self._index_item(item)
+        return len(self.items) - before
+    
+    def update_item(self, item_id: str, field_values: Dict[str, Any]) -> Item:
+        """
+        Update fields of an item and keep the search index in sync.
+        
+        Raises:
+            KeyError: if the item is not in the inventory
+            ValueError: if a field is unknown or a value fails validation
+        """
+        item = self.items[item_id]
+        try:
+            for field_name, value in field_values.items():
+                item.update_field(field_name, value)
+        finally:
+            self._unindex_item(item_id)
+            self._index_item(item)
+            self._search_cache.clear()
+            self.version += 1
+        return item
+    
     def remove_item(self, item_id: str) -> bool:
         """Remove item from inventory."""
         if item_id in self.items:
             del self.items[item_id]
+            self._unindex_item(item_id)
+            self._search_cache.clear()
+            self._all_items = None
+            self.version += 1
             return True
         return False
     
@@ -187,26 +355,73 @@ class Inventory:
         """Get item by ID."""
         return self.items.get(item_id)
     
-    def get_all_items(self) -> List[Item]:
-        """Get all items."""
-        return list(self.items.values())
+    def get_all_items(self) -> Tuple[Item, ...]:
+        """
+        Get all items, in insertion order.
+        
+        Returns a shared tuple that is only rebuilt after items are added or
+        removed, so repeated calls between changes cost nothing.
+        """
+        if self._all_items is None:
+            self._all_items = tuple(self.items.values())
+        return self._all_items
     
     def search_items(self, query: str) -> List[Item]:
-        """Search items by name or other searchable fields."""
+        """
+        Search items by name or other searchable fields.
+        
+        The last SEARCH_CACHE_SIZE results are cached per query, so retyping
+        or backspacing over a query is a dict lookup until the next change.
+        """
         if not query:
-            return self.get_all_items()
+            return list(self.get_all_items())
         
         query = query.lower()
-        results = []
+        cached = self._search_cache.get(query)
+        if cached is None:
+            cached = self._search(query)
+            self._search_cache[query] = cached
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        else:
+            self._search_cache.move_to_end(query)
+        return list(cached)
+    
+    def _search(self, query: str) -> List[Item]:
+        """Uncached search for an already lowercased query."""
+        query_tokens = _TOKEN_RE.findall(query)
         
-        for item in self.items.values():
-            # Search in all text fields
-            for field_name, value in item.data.items():
-                if isinstance(value, str) and query in value.lower():
-                    results.append(item)
-                    break
+        if not query_tokens:
+            # Nothing indexable (e.g. only punctuation): scan all text fields
+            text = self._search_text
+            return [item for item_id, item in self.items.items() if query in text[item_id]]
         
-        return results
+        # Narrow down with the inverted index. A substring match on the whole
+        # query implies every query token is a substring of some indexed
+        # token, so substring-matching each query token against the token
+        # vocabulary never drops a real match. This is still a scan: the
+        # vocabulary usually has far fewer entries than there are items,
+        # but nothing bounds it, and whole-token queries take the same path
+        # (an exact index lookup alone would miss longer tokens containing
+        # the query, e.g. "lap" in "laptop").
+        candidates = None
+        for query_token in query_tokens:
+            ids = set()
+            for token, token_ids in self._token_index.items():
+                if query_token in token:
+                    ids |= token_ids
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        
+        # Confirm the full query against the remaining candidates. This walks
+        # every item once, to keep inventory order, but only candidates pay
+        # for the substring check
+        text = self._search_text
+        return [
+            item for item_id, item in self.items.items()
+            if item_id in candidates and query in text[item_id]
+        ]
     
     def filter_items(self, **filters) -> List[Item]:
         """Filter items by field values."""
@@ -8,9 +8,38 @@ Uses sqlite3 for portable storage.
 
 import sqlite3
 import json
-from typing import List, Dict, Any, Optional
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
 
+# Database files whose schema has already been created in this process
+_schema_ready = set()
+
+# Let SQLite memory-map up to 256 MB of the file for reads
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Per-connection tuning. WAL (set once per file in _init_tables) only needs
+# synchronous=NORMAL to stay crash-safe, which avoids an fsync per commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MB page cache
+    f"PRAGMA mmap_size={MMAP_SIZE}",
+)
+
+# SQL shared by the item methods. Keeping the exact same strings lets the
+# connection's statement cache reuse the prepared statements.
+_SQL_UPSERT = """
+    INSERT OR REPLACE INTO items (id, created_at, updated_at, data)
+    VALUES (?, ?, ?, ?)
+"""
+_SQL_DELETE = "DELETE FROM items WHERE id = ?"
+# Keyset pagination over the primary key, for iter_items()
+_SQL_FIRST_BATCH = "SELECT id, data FROM items ORDER BY id LIMIT ?"
+_SQL_NEXT_BATCH = "SELECT id, data FROM items WHERE id > ? ORDER BY id LIMIT ?"
+_SQL_CLEAR = "DELETE FROM items"
+
 
 class Database:
     """Simple database wrapper for inventory management."""
@@ -18,6 +47,8 @@ class Database:
     def __init__(self, db_path: str = "data/inventory.db"):
         """Initialize database connection."""
         self.db_path = db_path
+        self._conn = None
+        self._lock = threading.Lock()
         
         # Ensure data directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -25,9 +56,43 @@ class Database:
         # Initialize database
         self._init_tables()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the performance PRAGMAs applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block on the long-lived connection as one transaction.
+        
+        The connection is opened on first use and shared by the GUI and the
+        background writer thread, so access is serialized with a lock.
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            with self._conn:
+                yield self._conn
+    
+    def close(self):
+        """Close the long-lived connection, if one is open."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
     def _init_tables(self):
-        """Create the items table if it doesn't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Create the items table if it doesn't exist (once per process per file)."""
+        key = str(Path(self.db_path).resolve())
+        if key in _schema_ready and Path(key).exists():
+            return
+        
+        with self._transaction() as conn:
+            # Write-ahead logging is persistent, so it is set once per file
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS items (
                     id TEXT PRIMARY KEY,
@@ -36,71 +101,121 @@ class Database:
                     data TEXT NOT NULL
                 )
             """)
-            conn.commit()
+        _schema_ready.add(key)
     
     def save_item(self, item_dict: Dict[str, Any]) -> bool:
         """Save an item to the database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO items (id, created_at, updated_at, data)
-                    VALUES (?, ?, ?, ?)
-                """, (
+            with self._transaction() as conn:
+                conn.execute(_SQL_UPSERT, (
                     item_dict['id'],
                     item_dict['created_at'],
                     item_dict['updated_at'],
                     json.dumps(item_dict)
                 ))
-                conn.commit()
             return True
         except Exception as e:
             print(f"Error saving item: {e}")
             return False
-    
-    def get_all_items(self) -> List[Dict[str, Any]]:
-        """Get all items from the database."""
+
+    def save_row(self, row: Tuple[str, str, str, str]) -> bool:
+        """Insert or replace one pre-serialized row (see Item.to_row())."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("SELECT data FROM items")
-                rows = cursor.fetchall()
-                
-                items = []
-                for row in rows:
-                    try:
-                        item_data = json.loads(row[0])
-                        items.append(item_data)
-                    except json.JSONDecodeError:
-                        continue
-                
-                return items
+            with self._transaction() as conn:
+                conn.execute(_SQL_UPSERT, row)
+            return True
         except Exception as e:
-            print(f"Error loading items: {e}")
-            return []
-    
+            print(f"Error saving item: {e}")
+            return False
+
+    def save_rows(self, rows: Iterable[Tuple[str, str, str, str]], defer_indexes: bool = False) -> bool:
+        """
+        Insert or replace pre-serialized rows in a single transaction.
+        
+        Each row is (id, created_at, updated_at, data_json), as produced by
+        Item.to_row(). With `defer_indexes`, secondary indexes on the items
+        table are dropped for the insert and rebuilt once afterwards, inside
+        the same transaction; worthwhile only for large batches.
+        """
+        try:
+            with self._transaction() as conn:
+                if not defer_indexes:
+                    conn.executemany(_SQL_UPSERT, rows)
+                else:
+                    # Explicit BEGIN so the DDL is part of the transaction too
+                    conn.execute("BEGIN")
+                    indexes = conn.execute(
+                        "SELECT name, sql FROM sqlite_master "
+                        "WHERE type='index' AND tbl_name='items' AND sql IS NOT NULL"
+                    ).fetchall()
+                    for name, _ in indexes:
+                        conn.execute('DROP INDEX "' + name.replace('"', '""') + '"')
+                    conn.executemany(_SQL_UPSERT, rows)
+                    for _, sql in indexes:
+                        conn.execute(sql)
+            return True
+        except Exception as e:
+            print(f"Error saving items: {e}")
+            return False
+
+    def get_all_items(self) -> List[Dict[str, Any]]:
+        """Get all items from the database."""
+        return list(self.iter_items())
+
+    def iter_items(self, batch_size: int = 10_000) -> Iterator[Dict[str, Any]]:
+        """
+        Yield decoded items, fetching `batch_size` rows at a time.
+        
+        Each batch is its own query, read in id order after the last id
+        seen, so the connection lock is only held while a batch is fetched.
+        Decoding and whatever the caller does with the items happen with
+        the lock released, leaving the connection free for other threads.
+        """
+        loads = json.loads
+        last_id = None
+        while True:
+            try:
+                with self._transaction() as conn:
+                    if last_id is None:
+                        rows = conn.execute(_SQL_FIRST_BATCH, (batch_size,)).fetchall()
+                    else:
+                        rows = conn.execute(_SQL_NEXT_BATCH, (last_id, batch_size)).fetchall()
+            except Exception as e:
+                print(f"Error loading items: {e}")
+                return
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            for _, data in rows:
+                try:
+                    yield loads(data)
+                except json.JSONDecodeError:
+                    continue
+
     def delete_item(self, item_id: str) -> bool:
         """Delete an item from the database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
-                conn.commit()
+            with self._transaction() as conn:
+                conn.execute(_SQL_DELETE, (item_id,))
             return True
         except Exception as e:
             print(f"Error deleting item: {e}")
             return False
     
-    def clear_items(self):
+    def clear_items(self) -> bool:
         """Clear all items from the database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("DELETE FROM items")
-                conn.commit()
+            with self._transaction() as conn:
+                conn.execute(_SQL_CLEAR)
+            return True
         except Exception as e:
             print(f"Error clearing items: {e}")
+            return False
     
     def item_exists(self, item_id: str) -> bool:
         """Check if an item exists in the database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.execute("SELECT COUNT(*) FROM items WHERE id = ?", (item_id,))
                 count = cursor.fetchone()[0]
                 return count > 0
@@ -108,6 +223,40 @@ class Database:
             print(f"Error checking item existence: {e}")
             return False
     
+    def get_table_names(self) -> List[str]:
+        """List the tables in the database file."""
+        try:
+            with self._transaction() as conn:
+                cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                return [row[0] for row in cursor]
+        except Exception as e:
+            print(f"Error listing tables: {e}")
+            return []
+    
+    def get_table_info(self, table: str) -> Tuple[Tuple[Any, ...], ...]:
+        """Return the PRAGMA table_info rows for `table`."""
+        quoted = '"' + table.replace('"', '""') + '"'
+        try:
+            with self._transaction() as conn:
+                return tuple(conn.execute(f"PRAGMA table_info({quoted})"))
+        except Exception as e:
+            print(f"Error reading table info: {e}")
+            return ()
+    
+    def get_column_names(self, table: str) -> Tuple[str, ...]:
+        """Return the column names of `table` as a tuple."""
+        return tuple(col[1] for col in self.get_table_info(table))
+    
+    def fetch_rows(self, table: str, limit: int) -> List[Tuple[Any, ...]]:
+        """Fetch up to `limit` raw rows from `table`."""
+        quoted = '"' + table.replace('"', '""') + '"'
+        try:
+            with self._transaction() as conn:
+                return conn.execute(f"SELECT * FROM {quoted} LIMIT ?", (limit,)).fetchall()
+        except Exception as e:
+            print(f"Error reading rows: {e}")
+            return []
+    
     def update_item(self, item_dict: Dict[str, Any]) -> bool:
         """Update an existing item in the database."""
         return self.save_item(item_dict)  # save_item already handles INSERT OR REPLACE
\ No newline at end of file
@@ -10,29 +10,159 @@ Version: 2.0.0
 """
 
 import tkinter as tk
-from tkinter import messagebox, ttk, font, filedialog
+from tkinter import messagebox, ttk, font
+from contextlib import contextmanager
 from decimal import Decimal
+from functools import lru_cache, partial
+import itertools
 import os
+import queue
+import re
+import threading
 
 from db.database import Database
 from core.inventory import Item, Inventory
-from core.config import get_inventory_fields, get_inventory_type, setup_inventory_type, set_inventory_type, InventoryType, get_inventory_types
-from core.datasheet_importer import ingest_file, get_supported_extensions
+from core.config import get_inventory_fields, get_inventory_type, setup_inventory_type, set_inventory_type, InventoryType, get_inventory_types, save_config
 
 # Global state
 inventory = Inventory()
 database = None
 field_entries = {}  # Will store entry widgets for each field
+entry_specs = ()  # (field name, required, type, converter, entry widget) per field, for form reads
+listbox = None  # Main inventory table, created in run_gui()
+input_frame = None  # Frame holding the field entry widgets
+
+# Field configuration of the active inventory type, cached for the session.
+# Call _invalidate_fields_cache() whenever the inventory type changes.
+_fields_cache = None
+_field_names_cache = None
+_field_labels_cache = None
+_table_columns_cache = None
+_column_specs_cache = None
+
+_hidden_columns = set()  # Field names the user has hidden from the table
+_column_menu = None  # (table, field names, menu, BooleanVars) of the heading menu, built on first use
+_app_fonts = ()  # Named fonts created by setup_styles(), kept alive for the session
+
+
+def _fields():
+    """Return the active inventory type's field configuration (cached)."""
+    global _fields_cache
+    if _fields_cache is None:
+        _fields_cache = tuple(get_inventory_fields())
+    return _fields_cache
+
+
+def _field_names():
+    """Return the active inventory type's field names (cached)."""
+    global _field_names_cache
+    if _field_names_cache is None:
+        _field_names_cache = tuple(field["name"] for field in _fields())
+    return _field_names_cache
+
+
+def _field_labels():
+    """Return display labels ("min_stock" -> "Min Stock"), built once per type."""
+    global _field_labels_cache
+    if _field_labels_cache is None:
+        _field_labels_cache = tuple(name.replace("_", " ").title() for name in _field_names())
+    return _field_labels_cache
+
+
+def _table_columns():
+    """Return the table's column identifiers: '#' plus one per field (cached)."""
+    global _table_columns_cache
+    if _table_columns_cache is None:
+        _table_columns_cache = ('#',) + tuple(name.title() for name in _field_names())
+    return _table_columns_cache
+
+
+def _column_specs():
+    """Return (column id, heading, width, anchor) per table column (cached)."""
+    global _column_specs_cache
+    if _column_specs_cache is None:
+        specs = [('#1', '#', 40, 'center')]
+        for i, label in enumerate(_field_labels(), 2):
+            # Width follows the heading length
+            specs.append((f'#{i}', label, max(100, len(label) * 10 + 20), 'w'))
+        _column_specs_cache = tuple(specs)
+    return _column_specs_cache
+
+
+def _configure_columns(table):
+    """Apply the cached headings and widths to the table's columns."""
+    heading = table.heading
+    column = table.column
+    for column_id, text, width, anchor in _column_specs():
+        heading(column_id, text=text)
+        column(column_id, width=width, anchor=anchor)
+
+
+def _apply_hidden_columns(table):
+    """Show every table column except the fields in _hidden_columns."""
+    if not _hidden_columns:
+        table.configure(displaycolumns='#all')
+        return
+    # Column 0 is the row number and always stays visible
+    table.configure(displaycolumns=[0] + [
+        i for i, name in enumerate(_field_names(), 1) if name not in _hidden_columns
+    ])
+
+
+def _toggle_column(table, field_name):
+    """Hide or show one field's column without touching the rows."""
+    _hidden_columns.symmetric_difference_update((field_name,))
+    _apply_hidden_columns(table)
+
+
+def _show_column_menu(event, table):
+    """Right-click on a heading: pop up checkbuttons for the field columns."""
+    global _column_menu
+    if table.identify_region(event.x, event.y) != "heading":
+        return
+    field_names = _field_names()
+    # Built once and reused; rebuilt only when the inventory type changed
+    # the fields (or the table was replaced)
+    if _column_menu is None or _column_menu[:2] != (table, field_names):
+        if _column_menu is not None:
+            _column_menu[2].destroy()
+        menu = tk.Menu(table)
+        variables = []
+        for name, label in zip(field_names, _field_labels()):
+            shown = tk.BooleanVar(menu)
+            variables.append(shown)
+            menu.add_checkbutton(label=label, variable=shown,
+                                 command=partial(_toggle_column, table, name))
+        _column_menu = (table, field_names, menu, variables)
+    _, _, menu, variables = _column_menu
+    for name, shown in zip(field_names, variables):
+        shown.set(name not in _hidden_columns)
+    menu.tk_popup(event.x_root, event.y_root)
+
+
+def _invalidate_fields_cache():
+    """Forget the cached field configuration after an inventory type change."""
+    global _fields_cache, _field_names_cache, _field_labels_cache, _table_columns_cache
+    global _column_specs_cache
+    _fields_cache = None
+    _field_names_cache = None
+    _field_labels_cache = None
+    _table_columns_cache = None
+    _column_specs_cache = None
 
 
 def initialize_inventory_setup():
     """Setup inventory type if not already configured."""
     if not get_inventory_type():
         setup_inventory_type()
+    _invalidate_fields_cache()
 
 def choose_database(root, listbox):
     """Choose or create a database file for the inventory."""
-    global database, inventory
+    global database, inventory, _base_title
+    
+    # Dialog module is only needed once the user picks a file
+    from tkinter import filedialog
     
     # Start in the data directory where databases are stored
     from pathlib import Path
@@ -56,109 +186,338 @@ def choose_database(root, listbox):
     
     if db_path:
         try:
+            # Let queued writes reach the old database before switching
+            flush_db_writes()
+            if database:
+                database.close()
             database = Database(db_path)
-            root.title(f"Inventory Management - {os.path.basename(db_path)}")
+            _table_info_cache.clear()
+            _base_title = f"Inventory Management - {os.path.basename(db_path)}"
+            _set_window_title(root)
             load_inventory_from_database()
             refresh_listbox(listbox, filtered_items)
             messagebox.showinfo("Database", f"Database loaded successfully!\n{os.path.basename(db_path)}")
         except Exception as e:
             messagebox.showerror("Database Error", f"Error loading database:\n{str(e)}")
 
+def _read_database_items(db, fields):
+    """Read and build every item stored in `db`; safe to run on a worker thread."""
+    # Make sure queued writes have landed before reading them back
+    flush_db_writes()
+    
+    # Stream rows from one query and build every item with one prepared
+    # row loader
+    load_row = Item.row_loader(fields)
+    loaded_items = []
+    failed = 0
+    first_error = None
+    for item_data in db.iter_items():
+        try:
+            loaded_items.append(load_row(item_data))
+        except Exception as e:
+            # Reported once after the loop rather than printed per row
+            failed += 1
+            if first_error is None:
+                first_error = (e, item_data)
+    if failed:
+        print(f"Could not load {failed} items; first error: {first_error[0]}")
+        print(f"Item data was: {first_error[1]}")
+    return loaded_items
+
+
+def _install_items(loaded_items, keep=()):
+    """Replace the inventory with `loaded_items`, plus the `keep` items on top."""
+    global inventory, filtered_items
+    
+    inventory = Inventory()
+    _format_row.cache_clear()
+    inventory.bulk_add(loaded_items)
+    if keep:
+        inventory.bulk_add(keep)
+    
+    print(f"Loaded {len(inventory)} items from database")
+    
+    # Update filtered_items to show all loaded items
+    filtered_items = inventory.get_all_items()
+
+
 def load_inventory_from_database():
     """Load all items from the database into the inventory."""
-    global inventory, database
-    
+    if not database:
+        return
+    _install_items(_read_database_items(database, _fields()))
+
+
+LOAD_POLL_MS = 50  # How often the UI checks whether the startup load finished
+
+def load_inventory_in_background(listbox):
+    """
+    Load the inventory on a worker thread and show it once read.
+    
+    The window stays responsive while the database is read. Items added
+    in the meantime are kept, since their writes may have been queued
+    after the worker's read. The result is dropped if the database, the
+    inventory type or the inventory itself was replaced before it arrived
+    (Choose Database, Change Inventory Type, Clear All Data), since those
+    have already loaded or cleared the inventory they want shown.
+    """
     if not database:
         return
     
-    inventory = Inventory()
-    
-    # Get all items from database
-    items_data = database.get_all_items()
-    print(f"Loading {len(items_data)} items from database...")
+    db = database
+    started_with = inventory
+    fields = _fields()
+    outcome = {}
     
-    for item_data in items_data:
+    def work():
         try:
-            # Convert to dict and let Item constructor handle all fields properly
-            item_dict = dict(item_data)
-            print(f"Loading item data: {item_dict}")
-            
-            item = Item(**item_dict)
-            inventory.add_item(item)
-            # Get the appropriate display name based on inventory type
-            display_name = (item.data.get('name') or 
-                          item.data.get('title') or 
-                          item.data.get('model') or 
-                          f"Item {item.id[:8]}")
-            print(f"Loaded item: {display_name} (ID: {item.id})")
+            outcome['items'] = _read_database_items(db, fields)
         except Exception as e:
-            print(f"Error loading item: {e}")
-            print(f"Item data was: {item_data}")
-            print(f"Item data: {item_data}")
+            outcome['error'] = e
     
-    print(f"Successfully loaded {len(inventory.get_all_items())} items into inventory")
+    worker = threading.Thread(target=work, name="database-load", daemon=True)
+    worker.start()
     
-    # Update filtered_items to show all loaded items
-    global filtered_items
-    filtered_items = inventory.get_all_items()
-
-def save_inventory_to_database():
-    """Save all inventory items to the database safely."""
-    global inventory, database, save_pending
+    def poll():
+        if worker.is_alive():
+            listbox.after(LOAD_POLL_MS, poll)
+            return
+        if database is not db or inventory is not started_with or _fields() != fields:
+            return  # stale: read from a database or type no longer shown
+        if 'error' in outcome:
+            messagebox.showerror("Database Error", f"Error loading inventory: {outcome['error']}")
+            return
+        _install_items(outcome['items'], keep=inventory.get_all_items())
+        refresh_listbox(listbox, filtered_items)
     
-    if not database or not inventory:
-        return
+    listbox.after(LOAD_POLL_MS, poll)
+
+
+# --- Background database writer ---
+# Database writes run on one worker thread so the Tk main loop never waits
+# on disk. Writes are applied in the order they were queued; failures are
+# collected and reported on the UI thread by _report_db_errors().
+_db_queue = queue.Queue()
+_db_errors = queue.Queue()
+_db_worker = None
+
+
+def _row_save_target(write):
+    """The Database a queued write saves a single row to, else None."""
+    operation = write[0]
+    if getattr(operation, "__func__", None) is Database.save_row:
+        return operation.__self__
+    return None
+
+
+def _coalesce_writes(writes):
+    """
+    Merge runs of save_row() calls on the same database into a single
+    save_rows() call, so a burst of edits is committed as one transaction.
+    Other writes are kept as they are, in order.
+    """
+    merged = []
+    for target, run in itertools.groupby(writes, _row_save_target):
+        run = list(run)
+        if target is None or len(run) == 1:
+            merged.extend(run)
+        else:
+            merged.append((partial(_save_run, target, run), (), f"save {len(run)} items"))
+    return merged
+
+
+def _save_run(db, run):
+    """
+    Save a run of queued save_row() writes in one transaction.
     
+    One bad row rolls back the whole batch, so on failure each row is
+    retried on its own: the good rows still land and the error names
+    the item that failed.
+    """
+    if db.save_rows([args[0] for _, args, _ in run]):
+        return True
+    for operation, args, description in run:
+        _apply_write(operation, args, f"{description} (item {args[0][0]})")
+    return None  # failures, if any, were reported per row
+
+
+def _apply_write(operation, args, description):
+    """Run one queued write, reporting a failure for the UI thread."""
     try:
-        # Get all items to save
-        items_data = [item.to_dict() for item in inventory.get_all_items()]
-        
-        if not items_data:
-            print("Warning: No items to save to database")
-            return
-        
-        # SAFE APPROACH: Save first, then clear old data
-        # This prevents data loss if save fails
-        print(f"Saving {len(items_data)} items to database...")
-        
-        # Clear and save in a transaction for atomicity
-        database.clear_items()
-        
-        saved_count = 0
-        for item_data in items_data:
-            if database.save_item(item_data):
-                saved_count += 1
-            else:
-                print(f"Failed to save item: {item_data.get('id', 'unknown')}")
-        
-        print(f"Successfully saved {saved_count}/{len(items_data)} items to database")
-        save_pending = False
-        
+        if operation(*args) is False:
+            _db_errors.put(f"Could not {description}.")
     except Exception as e:
-        print(f"Error saving inventory to database: {e}")
-        # Don't set save_pending = False if there was an error
+        _db_errors.put(f"Could not {description}: {e}")
+
+
+def _db_worker_loop():
+    """Apply queued database writes, batching whatever queued up meanwhile."""
+    while True:
+        writes = [_db_queue.get()]
+        # Edits made while the previous write ran are applied together
+        while True:
+            try:
+                writes.append(_db_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            for operation, args, description in _coalesce_writes(writes):
+                _apply_write(operation, args, description)
+        finally:
+            for _ in writes:
+                _db_queue.task_done()
+
+
+def queue_db_write(operation, *args, description="write to the database"):
+    """Queue a Database method call to run on the background writer."""
+    global _db_worker
+    if _db_worker is None:
+        _db_worker = threading.Thread(target=_db_worker_loop, name="db-writer", daemon=True)
+        _db_worker.start()
+    _db_queue.put((operation, args, description))
+
+
+def flush_db_writes():
+    """Block until every queued database write has been applied."""
+    if _db_worker is not None:
+        _db_queue.join()
 
-def mark_for_save():
-    """Mark that the inventory needs to be saved."""
-    global save_pending
-    save_pending = True
+
+def _report_db_errors(root):
+    """Show failed background writes, then poll again shortly."""
+    errors = []
+    while True:
+        try:
+            errors.append(_db_errors.get_nowait())
+        except queue.Empty:
+            break
+    if errors:
+        messagebox.showerror("Database Error", "\n".join(errors))
+    root.after(100, _report_db_errors, root)
 
 
 # Global variables for pagination and performance
 current_page = 0
 items_per_page = 100
 filtered_items = []
-save_pending = False
+SEARCH_DEBOUNCE_MS = 150  # Delay after the last keystroke before searching
+SELECT_DEBOUNCE_MS = 30  # Delay after the last selection change before filling the form
+RENDER_FIRST_ROWS = 60  # Rows inserted immediately on refresh; covers the visible window
+RENDER_CHUNK_ROWS = 200  # Rows per follow-up insert while filling the rest of a page
+_fill_job = None  # Pending after() id of the page fill, if any
+_shown_search = None  # (inventory, version, query) on screen after a search, until the next refresh
+_row_keys = {}  # iid -> (row number, item, updated_at, field names) of the rows on screen
+_base_title = "Inventory Management System"  # Window title without the page info
+_shown_title = None  # Title last set by _set_window_title()
+
+_EMPTY_CELLS = itertools.repeat("")  # default value for every missing field
+
+@lru_cache(maxsize=2048)
+def _format_row(item, version, field_names):
+    """
+    Format an item's field values for the table.
+    
+    Cached per (item, version, field_names): `version` is the item's
+    updated_at, so edits produce a new key, and paging back and forth or
+    re-running a search reuses the strings already built.
+    """
+    data = item.data
+    # Text fields are already strings and Decimal/int go straight through
+    # str(); no format-spec parsing happens per cell.
+    return tuple(
+        value if value.__class__ is str else "" if value is None else str(value)
+        for value in map(data.get, field_names, _EMPTY_CELLS)
+    )
+
+
+def _insert_rows(table, items, first_number, field_names):
+    """Insert table rows for `items`, numbering them from `first_number`."""
+    # Format every row first so the insert loop does no formatting;
+    # unchanged items come from the row cache. Rows are keyed by item id
+    # (the Treeview iid), so selection handlers look items up directly.
+    # The formatter is bound locally so the per-row lookup is not a global one
+    format_row = _format_row
+    rows = [
+        (item.id, (str(i),) + format_row(item, item.updated_at, field_names))  # Index column + fields
+        for i, item in enumerate(items, first_number)
+    ]
+    _row_keys.update((item.id, (i, item, item.updated_at, field_names))
+                     for i, item in enumerate(items, first_number))
+    
+    with _scrollbars_paused(table):
+        insert = table.insert
+        for item_id, values in rows:
+            insert('', 'end', iid=item_id, values=values)
+
+
+@contextmanager
+def _scrollbars_paused(table):
+    """
+    Detach the table's scrollbars for a batch of row changes (Tk's take on
+    WM_SETREDRAW=FALSE), so they are recomputed once per batch instead of
+    once per row.
+    """
+    yscrollcommand = table.cget('yscrollcommand')
+    xscrollcommand = table.cget('xscrollcommand')
+    table.configure(yscrollcommand='', xscrollcommand='')
+    try:
+        yield
+    finally:
+        table.configure(yscrollcommand=yscrollcommand, xscrollcommand=xscrollcommand)
+
+
+def _sync_rows(table, items, first_number, field_names, kept):
+    """
+    Make the table show `items`, reusing the `kept` rows already on screen.
+    
+    The kept rows must already be in the same relative order as in
+    `items`; they are only rewritten when their number or item changed,
+    and the other items are inserted in place between them.
+    """
+    insert = table.insert
+    format_row = _format_row
+    row_keys = _row_keys
+    with _scrollbars_paused(table):
+        for index, (number, item) in enumerate(enumerate(items, first_number)):
+            key = (number, item, item.updated_at, field_names)
+            if item.id not in kept:
+                insert('', index, iid=item.id,
+                       values=(str(number),) + format_row(item, item.updated_at, field_names))
+            elif row_keys.get(item.id) != key:
+                table.item(item.id, values=(str(number),) + format_row(item, item.updated_at, field_names))
+            else:
+                continue
+            row_keys[item.id] = key
+
+
+def _fill_rows(table, page_items, start, first_number, field_names):
+    """Insert the next chunk of a page, rescheduling until it is complete."""
+    global _fill_job
+    end = start + RENDER_CHUNK_ROWS
+    _insert_rows(table, page_items[start:end], first_number + start, field_names)
+    if end < len(page_items):
+        _fill_job = table.after(1, _fill_rows, table, page_items, end, first_number, field_names)
+    else:
+        _fill_job = None
+
 
 def refresh_listbox(table, items_to_show=None):
     """Refresh the table with current inventory items."""
-    global inventory, filtered_items, current_page
+    global inventory, filtered_items, current_page, _fill_job, _shown_search
+    
+    _shown_search = None
     
-    # Clear existing items
-    for item in table.get_children():
-        table.delete(item)
+    # Drop any rows still waiting to be filled in from the previous refresh
+    if _fill_job is not None:
+        table.after_cancel(_fill_job)
+        _fill_job = None
     
+    children = table.get_children()
     if not inventory:
+        if children:
+            table.delete(*children)
+        _row_keys.clear()
+        _set_window_title(table)
         return
     
     # Use provided items or get all items and update global filtered_items
@@ -169,8 +528,7 @@ def refresh_listbox(table, items_to_show=None):
         items = inventory.get_all_items()
         filtered_items = items
     
-    fields = get_inventory_fields()
-    field_names = [field["name"] for field in fields]
+    field_names = _field_names()
     
     # Calculate pagination
     total_items = len(items)
@@ -180,29 +538,119 @@ def refresh_listbox(table, items_to_show=None):
     # Show only current page items
     page_items = items[start_idx:end_idx]
     
-    # Batch insert for better performance
-    for i, item in enumerate(page_items, start_idx + 1):
-        values = [str(i)]  # Global index column
-        
-        # Add ALL field values using cached field names
-        for field_name in field_names:
-            value = item.data.get(field_name, "")
-            values.append(str(value) if value is not None else "")
-        
-        table.insert('', 'end', values=values)
+    # Rows of the visible window that stay on screen (narrowing a search,
+    # edits, reloads) are kept in place; the rest are deleted in one call
+    head = page_items[:RENDER_FIRST_ROWS]
+    head_ids = {item.id for item in head}
+    kept = [iid for iid in children if iid in head_ids]
+    kept_ids = set(kept)
+    if kept != [item.id for item in head if item.id in kept_ids]:
+        kept_ids = set()  # reordered, e.g. by a new sort; simpler to redraw
+    gone = [iid for iid in children if iid not in kept_ids]
+    if gone:
+        table.delete(*gone)
+    if not kept_ids:
+        _row_keys.clear()
+    
+    # Show the visible window now and insert the rest of the page in
+    # chunks from the event loop, so large pages appear without blocking
+    # input
+    if kept_ids:
+        _sync_rows(table, head, start_idx + 1, field_names, kept_ids)
+    else:
+        _insert_rows(table, head, start_idx + 1, field_names)
+    if len(page_items) > RENDER_FIRST_ROWS:
+        _fill_job = table.after(1, _fill_rows, table, page_items, RENDER_FIRST_ROWS,
+                                start_idx + 1, field_names)
     
     # Update window title with pagination info
-    if hasattr(table.master, 'winfo_toplevel'):
-        toplevel = table.winfo_toplevel()
-        if total_items > items_per_page:
-            page_info = f" - Page {current_page + 1}/{(total_items - 1) // items_per_page + 1} ({start_idx + 1}-{end_idx} of {total_items})"
-            if hasattr(toplevel, 'title'):
-                current_title = toplevel.title()
-                if " - Page " in current_title:
-                    base_title = current_title.split(" - Page ")[0]
-                else:
-                    base_title = current_title
-                toplevel.title(base_title + page_info)
+    _show_page_info(table)
+
+
+def _show_page_info(table):
+    """Put the current page and item range in the window title."""
+    total_items = len(filtered_items)
+    if total_items > items_per_page:
+        start_idx = current_page * items_per_page
+        end_idx = min(start_idx + items_per_page, total_items)
+        _set_window_title(table, f" - Page {current_page + 1}/{(total_items - 1) // items_per_page + 1} ({start_idx + 1}-{end_idx} of {total_items})")
+    else:
+        _set_window_title(table)
+
+
+def _set_window_title(widget, page_info=""):
+    """Show `_base_title` plus `page_info`, touching Tk only when it changes."""
+    global _shown_title
+    title = _base_title + page_info
+    if title != _shown_title:
+        widget.winfo_toplevel().title(title)
+        _shown_title = title
+
+
+def _update_row(table, item):
+    """Redraw one item's row in place, keeping its row number."""
+    if table.exists(item.id):  # rows still being filled are formatted when inserted
+        number = table.set(item.id, '#1')
+        table.item(item.id, values=(number,) + _format_row(item, item.updated_at, _field_names()))
+        _row_keys.pop(item.id, None)
+
+
+def _append_row(table, item):
+    """
+    Show a newly added item without redrawing the page.
+    
+    Possible when the table shows every item, is on the last page and that
+    page has room: the new item is then the last row. Returns False when
+    the table needs a full refresh instead.
+    """
+    global filtered_items
+    start_idx = current_page * items_per_page
+    shown = len(filtered_items) - start_idx
+    if _fill_job is not None or not 0 <= shown < items_per_page:
+        return False
+    filtered_items = inventory.get_all_items()
+    _insert_rows(table, (item,), len(filtered_items), _field_names())
+    _show_page_info(table)
+    return True
+
+
+def _remove_row(table, item, showing_all=False):
+    """
+    Drop a deleted item's row, renumber the rows below it and pull the
+    first item of the next page up. Returns False when the table needs a
+    full refresh instead.
+    
+    `showing_all` says the table listed every item before the delete; the
+    view then stays the inventory's own all-items tuple, so later adds can
+    still take the _append_row() path.
+    """
+    global filtered_items
+    try:
+        position = filtered_items.index(item)
+    except ValueError:
+        return False
+    if showing_all:
+        filtered_items = inventory.get_all_items()
+    else:
+        filtered_items = filtered_items[:position] + filtered_items[position + 1:]
+    
+    start_idx = current_page * items_per_page
+    end_idx = start_idx + items_per_page
+    if _fill_job is not None or not table.exists(item.id):
+        return False
+    if position == start_idx and start_idx >= len(filtered_items):
+        return False  # the page is now empty; go through refresh_listbox
+    
+    table.delete(item.id)
+    _row_keys.clear()  # rows below were renumbered
+    set_cell = table.set
+    with _scrollbars_paused(table):
+        for number, row_id in enumerate(table.get_children()[position - start_idx:], position + 1):
+            set_cell(row_id, '#1', str(number))
+    if end_idx <= len(filtered_items):
+        _insert_rows(table, (filtered_items[end_idx - 1],), end_idx, _field_names())
+    _show_page_info(table)
+    return True
 
 
 # --- Modern UI Enhancements ---
@@ -230,10 +678,18 @@ def setup_styles():
     BUTTON_COLOR = "#34495E"    # Dark gray buttons
     BUTTON_HOVER = "#2C3E50"    # Darker on hover
 
-    # Define fonts
+    # Define fonts. Named fonts are created once and shared by every style
+    # that uses them, instead of Tk resolving a font tuple per style.
+    global _app_fonts
     default_font = font.nametofont("TkDefaultFont")
     default_font.configure(family="Segoe UI", size=10)
-    entry_font = font.Font(family="Segoe UI", size=11)
+    entry_font = font.Font(name="AppEntryFont", family="Segoe UI", size=11)
+    bold_font = font.Font(name="AppBoldFont", family="Segoe UI", size=10, weight="bold")
+    title_font = font.Font(name="AppTitleFont", family="Segoe UI", size=14, weight="bold")
+    subtitle_font = font.Font(name="AppSubtitleFont", family="Segoe UI", size=12, weight="bold")
+    section_font = font.Font(name="AppSectionFont", family="Segoe UI", size=9, weight="bold")
+    # Tk deletes a named font when its Font object is collected
+    _app_fonts = (entry_font, bold_font, title_font, subtitle_font, section_font)
 
     # Configure styles for widgets
     style.configure(".", background=BG_COLOR,
@@ -241,6 +697,10 @@ def setup_styles():
     style.configure("TFrame", background=BG_COLOR)
     style.configure("TLabel", background=BG_COLOR,
                     foreground=FG_COLOR, padding=(5, 5))
+    # Named label styles, so headings don't each carry a font option
+    style.configure("Title.TLabel", font=title_font)
+    style.configure("Subtitle.TLabel", font=subtitle_font)
+    style.configure("Section.TLabel", font=section_font)
     style.configure(
         "TEntry",
         fieldbackground=ENTRY_BG,
@@ -261,7 +721,7 @@ def setup_styles():
         borderwidth=1,
         relief="flat",
         padding=(12, 8),
-        font=("Segoe UI", 10, "bold"),
+        font=bold_font,
     )
     style.map(
         "TButton",
@@ -287,7 +747,7 @@ def setup_styles():
         fieldbackground="#FFFFFF",
         borderwidth=1,
         relief="solid",
-        font=("Segoe UI", 10),
+        font=default_font,
         rowheight=25
     )
     style.configure(
@@ -296,7 +756,7 @@ def setup_styles():
         foreground="#000000",
         borderwidth=1,
         relief="raised",
-        font=("Segoe UI", 10, "bold"),
+        font=bold_font,
         padding=(5, 5)
     )
     style.map(
@@ -312,6 +772,32 @@ def setup_styles():
 
 # --- Core Application Logic ---
 
+# Accepted spellings for numeric entries, checked before int()/Decimal()
+_INT_RE = re.compile(r"[+-]?\d+")
+_DEC_RE = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)")
+
+def _entry_to_int(value):
+    """Convert an INTEGER entry, rejecting malformed input with ValueError."""
+    if not _INT_RE.fullmatch(value):
+        raise ValueError(value)
+    return int(value)
+
+def _entry_to_decimal(value):
+    """
+    Convert a REAL entry, rejecting malformed input with ValueError.
+    
+    The regex check runs before Decimal(), which also keeps Decimal's
+    InvalidOperation and special values such as "NaN" out of the handlers.
+    """
+    if not _DEC_RE.fullmatch(value):
+        raise ValueError(value)
+    return Decimal(value)
+
+# Converters per field type, looked up once per field when the form or an
+# import plan is built; TEXT values are used as-is
+_ENTRY_CONVERTERS = {"INTEGER": _entry_to_int, "REAL": _entry_to_decimal}
+_IMPORT_CONVERTERS = {"INTEGER": lambda value: int(float(value)),  # Handle decimal strings
+                      "REAL": float}
 
 def add_item(listbox):
     """Add a new item to the inventory using field entries."""
@@ -322,52 +808,70 @@ def add_item(listbox):
         return
     
     # Collect data from all field entries
-    item_data = {}
-    fields = get_inventory_fields()
-    
-    for field in fields:
-        field_name = field["name"]
-        entry_widget = field_entries.get(field_name)
-        
-        if not entry_widget:
-            continue
-            
-        value = entry_widget.get().strip()
-        
-        # Validate required fields
-        if field["required"] and not value:
-            messagebox.showerror("Error", f"Field '{field_name}' is required.")
-            return
-        
-        # Type conversion
-        if value:
-            try:
-                if field["type"] == "INTEGER":
-                    value = int(value)
-                elif field["type"] == "REAL":
-                    value = Decimal(value)
-            except ValueError:
-                messagebox.showerror("Error", f"Invalid value for '{field_name}'. Expected {field['type']}.")
-                return
-        
-        item_data[field_name] = value
+    item_data = _read_entries()
+    if item_data is None:
+        return
     
     try:
+        global filtered_items, current_page
         item = Item(**item_data)
+        showing_all = filtered_items is inventory.get_all_items()
         inventory.add_item(item)
-        mark_for_save()
-        save_inventory_to_database()
-        # Update filtered_items with all current items and refresh
-        global filtered_items, current_page
-        filtered_items = inventory.get_all_items()
-        current_page = 0  # Reset to first page to show new item
-        refresh_listbox(listbox, filtered_items)
+        if database:
+            queue_db_write(database.save_row, item.to_row(), description="save the new item")
+        # Append just the new row when it lands on the page on screen;
+        # otherwise show all items again from the first page
+        if not (showing_all and _append_row(listbox, item)):
+            filtered_items = inventory.get_all_items()
+            current_page = 0
+            refresh_listbox(listbox, filtered_items)
         clear_entries()
         messagebox.showinfo("Success", "Item added successfully!")
     except Exception as e:
         messagebox.showerror("Error", f"Failed to add item: {str(e)}")
 
 
+def _read_entries():
+    """
+    Read, validate and convert the entry values in one pass.
+    
+    Returns a field name -> value dict, or None after showing one error
+    that lists every missing or invalid field.
+    """
+    item_data = {}
+    missing = []
+    invalid = []
+    for field_name, required, field_type, convert, entry_widget in entry_specs:
+        value = entry_widget.get().strip()
+        if not value:
+            if required:
+                missing.append(field_name)
+        elif convert:
+            try:
+                value = convert(value)
+            except ValueError:
+                invalid.append(f"'{field_name}' (expected {field_type})")
+        item_data[field_name] = value
+    
+    if missing or invalid:
+        problems = []
+        if missing:
+            problems.append("Required: " + ", ".join(f"'{name}'" for name in missing))
+        if invalid:
+            problems.append("Invalid value for: " + ", ".join(invalid))
+        messagebox.showerror("Error", "\n".join(problems))
+        return None
+    return item_data
+
+
+def _selected_item(listbox):
+    """Return the item of the selected table row (rows use item ids as iids)."""
+    selection = listbox.selection()
+    if not selection:
+        return None
+    return inventory.get_item(selection[0])
+
+
 def update_item(listbox):
     """Update the currently selected item in the inventory."""
     global inventory, field_entries
@@ -377,71 +881,29 @@ def update_item(listbox):
         return
     
     # Get selected item from treeview
-    selected_items = listbox.selection()
-    if not selected_items:
+    if not listbox.selection():
         messagebox.showerror("Error", "Please select an item to update.")
         return
     
-    # Get the item index from the first column of the selected row
-    item_values = listbox.item(selected_items[0])['values']
-    if not item_values:
-        messagebox.showerror("Error", "Invalid selection.")
-        return
-    
-    # The first column contains the item index (1-based)
-    try:
-        item_index = int(item_values[0]) - 1
-        items = inventory.get_all_items()
-        if item_index >= len(items):
-            messagebox.showerror("Error", "Invalid item selection.")
-            return
-        selected_item = items[item_index]
-    except (ValueError, IndexError):
+    selected_item = _selected_item(listbox)
+    if selected_item is None:
         messagebox.showerror("Error", "Invalid item selection.")
         return
     
     # Collect data from all field entries
-    item_data = {}
-    fields = get_inventory_fields()
-    
-    for field in fields:
-        field_name = field["name"]
-        entry_widget = field_entries.get(field_name)
-        
-        if not entry_widget:
-            continue
-            
-        value = entry_widget.get().strip()
-        
-        # Validate required fields
-        if field["required"] and not value:
-            messagebox.showerror("Error", f"Field '{field_name}' is required.")
-            return
-        
-        # Type conversion
-        if value:
-            try:
-                if field["type"] == "INTEGER":
-                    value = int(value)
-                elif field["type"] == "REAL":
-                    value = Decimal(value)
-            except ValueError:
-                messagebox.showerror("Error", f"Invalid value for '{field_name}'. Expected {field['type']}.")
-                return
-        
-        item_data[field_name] = value
+    item_data = _read_entries()
+    if item_data is None:
+        return
     
     try:
-        # Update the item's data
-        for field_name, value in item_data.items():
-            selected_item.update_field(field_name, value)
+        # Update the item's data (keeps the inventory's search index in sync)
+        inventory.update_item(selected_item.id, item_data)
         
-        mark_for_save()
-        save_inventory_to_database()
-        # Update filtered_items with all current items and refresh
-        global filtered_items
-        filtered_items = inventory.get_all_items()
-        refresh_listbox(listbox, filtered_items)
+        if database:
+            queue_db_write(database.save_row, selected_item.to_row(),
+                           description="save the updated item")
+        # Only the edited row changes on screen
+        _update_row(listbox, selected_item)
         clear_entries()
         messagebox.showinfo("Success", "Item updated successfully!")
     except Exception as e:
@@ -450,7 +912,7 @@ def update_item(listbox):
 
 def delete_item(listbox):
     """Delete the selected item from the inventory."""
-    global inventory
+    global inventory, current_page
     
     selected_items = listbox.selection()
     if not selected_items:
@@ -463,71 +925,43 @@ def delete_item(listbox):
         return
     
     try:
-        # Get the item index from the first column of the selected row
-        item_values = listbox.item(selected_items[0])['values']
-        if not item_values:
-            messagebox.showerror("Error", "Invalid selection.")
-            return
-        
-        # The first column contains the item index (1-based)
-        item_index = int(item_values[0]) - 1
-        items = inventory.get_all_items()
-        if item_index >= len(items):
+        selected_item = _selected_item(listbox)
+        if selected_item is None:
             messagebox.showerror("Error", "Invalid item selection.")
             return
         
-        selected_item = items[item_index]
+        showing_all = filtered_items is inventory.get_all_items()
         inventory.remove_item(selected_item.id)
-        mark_for_save()
-        save_inventory_to_database()
-        # Update filtered_items with all current items and refresh
-        global filtered_items
-        filtered_items = inventory.get_all_items()
-        refresh_listbox(listbox, filtered_items)
+        if database:
+            queue_db_write(database.delete_item, selected_item.id,
+                           description="delete the item")
+        # Remove just the deleted row when possible
+        if not _remove_row(listbox, selected_item, showing_all):
+            current_page = max(0, min(current_page, (len(filtered_items) - 1) // items_per_page))
+            refresh_listbox(listbox, filtered_items)
         clear_entries()
         messagebox.showinfo("Success", "Item deleted successfully!")
     except Exception as e:
         messagebox.showerror("Error", f"Failed to delete item: {str(e)}")
 
 
-def clear_entries():
-    """Clear all field entries."""
-    global field_entries
-    
-    for entry_widget in field_entries.values():
-        if hasattr(entry_widget, 'delete'):
-            entry_widget.delete(0, tk.END)
-
-
 def on_item_select(event, listbox):
     """Populate the entry fields with data from the selected treeview item."""
     global inventory, field_entries
     
-    selected_items = listbox.selection()
-    if not selected_items:
-        return
-    
     try:
-        # Get the item index from the first column of the selected row
-        item_values = listbox.item(selected_items[0])['values']
-        if not item_values:
+        selected_item = _selected_item(listbox)
+        if selected_item is None:
             return
         
-        # The first column contains the item index (1-based)
-        item_index = int(item_values[0]) - 1
-        items = inventory.get_all_items()
-        if item_index >= len(items):
-            return
-        
-        selected_item = items[item_index]
-        
         # Clear all fields first
         clear_entries()
         
         # Populate fields with item data
+        data = selected_item.data
         for field_name, entry_widget in field_entries.items():
-            if hasattr(entry_widget, 'insert'):
-                value = selected_item.data.get(field_name, "")
+            value = data.get(field_name)
+            if value is not None:
                 entry_widget.insert(0, str(value))
                 
     except (IndexError, KeyError, ValueError):
@@ -535,21 +969,25 @@ def on_item_select(event, listbox):
 
 def search_items(search_entry, listbox):
     """Search for items based on the search query."""
-    global inventory, current_page
+    global inventory, current_page, _shown_search
     
     query = search_entry.get().strip()
-    current_page = 0  # Reset to first page when searching
     
-    if not query:
-        # If no query, show all items
-        refresh_listbox(listbox, filtered_items)
+    # Keys that don't change the query (arrows, Shift, ...) still schedule a
+    # search; skip it while the table already shows this query's first page
+    shown = (inventory, inventory.version, query)
+    if shown == _shown_search:
         return
     
-    # Search for matching items
-    matching_items = inventory.search_items(query)
+    current_page = 0  # Reset to first page when searching
     
-    # Use the optimized refresh function with filtered items
-    refresh_listbox(listbox, matching_items)
+    if not query:
+        # If no query, show all items
+        refresh_listbox(listbox)
+    else:
+        # Use the optimized refresh function with the matching items
+        refresh_listbox(listbox, inventory.search_items(query))
+    _shown_search = shown
 
 def next_page(listbox):
     """Go to next page."""
@@ -585,20 +1023,24 @@ def set_items_per_page(new_size, listbox):
 # times in dev but typically called only when __main__.
 def create_input_fields(parent_frame):
     """Create input fields based on current inventory configuration."""
-    global field_entries
+    global field_entries, entry_specs
     
-    fields = get_inventory_fields()
+    fields = _fields()
+    old_entries = field_entries
     field_entries = {}
+    specs = []
     
-    # Clear existing fields
+    # Clear existing labels; entries for fields the new type still has are
+    # kept (with their contents) and only re-gridded
+    kept = set(old_entries.values())
     for widget in parent_frame.winfo_children():
-        widget.destroy()
+        if widget not in kept:
+            widget.destroy()
     
     parent_frame.columnconfigure(1, weight=1)
     
-    for i, field in enumerate(fields):
+    for i, (field, label_text) in enumerate(zip(fields, _field_labels())):
         field_name = field["name"]
-        label_text = field_name.replace("_", " ").title()
         
         # Add required indicator
         if field["required"]:
@@ -608,10 +1050,18 @@ def create_input_fields(parent_frame):
             row=i, column=0, sticky="w", padx=(0, 5), pady=5
         )
         
-        entry = ttk.Entry(parent_frame)
+        entry = old_entries.pop(field_name, None) or ttk.Entry(parent_frame)
         entry.grid(row=i, column=1, sticky="ew", pady=5)
         
         field_entries[field_name] = entry
+        specs.append((field_name, field["required"], field["type"],
+                      _ENTRY_CONVERTERS.get(field["type"]), entry))
+    
+    entry_specs = tuple(specs)
+    
+    # Entries for fields the new type dropped
+    for entry in old_entries.values():
+        entry.destroy()
 
 def clear_entries():
     """Clear all field entries."""
@@ -619,12 +1069,16 @@ def clear_entries():
     for entry in field_entries.values():
         entry.delete(0, tk.END)
 
+DEFER_INDEXES_MIN_ROWS = 1000  # Imports this large rebuild indexes once at the end
+IMPORT_POLL_MS = 100  # How often the UI checks whether the import worker finished
+
 def import_datasheet(listbox):
     """Import data from CSV/TXT files."""
     global inventory, database
     
-    # Get supported file types for dialog
-    extensions = get_supported_extensions()
+    from tkinter import filedialog
+    
+    # File types for the dialog
     filetypes = []
     filetypes.append(("CSV files", "*.csv"))
     filetypes.append(("Text files", "*.txt"))
@@ -648,80 +1102,185 @@ def import_datasheet(listbox):
         if result:
             change_inventory_type()
         
-        # Import the file
-        tables = ingest_file(file_path)
+        # Parse on a worker thread behind a modal progress dialog, so a
+        # large file does not freeze the window
+        current_fields = _fields()
+        cancel = threading.Event()
+        outcome = {}
         
-        if not tables:
-            messagebox.showwarning("Import", "No data found in the selected file.")
-            return
+        def work():
+            try:
+                outcome['items'] = _parse_datasheet(file_path, current_fields, cancel)
+            except Exception as e:
+                outcome['error'] = e
         
-        imported_count = 0
-        for table_name, data in tables:
-            columns = data['columns']
-            rows = data['rows']
-            
-            # Try to map columns to current inventory fields
-            current_fields = get_inventory_fields()
-            field_mapping = {}
-            
-            # Simple mapping - look for similar names
-            for col in columns:
-                for field in current_fields:
-                    if col.lower() in field['name'].lower() or field['name'].lower() in col.lower():
-                        field_mapping[col] = field['name']
-                        break
-            
-            # Import rows
-            for row in rows:
-                if len(row) != len(columns):
-                    continue  # Skip malformed rows
-                
-                item_data = {}
-                for i, col in enumerate(columns):
-                    if i < len(row):
-                        value = row[i].strip() if row[i] else ""
-                        if col in field_mapping:
-                            # Map to inventory field
-                            field_name = field_mapping[col]
-                            # Find field config for type conversion
-                            field_config = next((f for f in current_fields if f['name'] == field_name), None)
-                            if field_config and value:
-                                try:
-                                    if field_config['type'] == 'INTEGER':
-                                        value = int(float(value))  # Handle decimal strings
-                                    elif field_config['type'] == 'REAL':
-                                        value = float(value)
-                                except ValueError:
-                                    pass  # Keep as string if conversion fails
-                            item_data[field_name] = value
-                
-                # Only create item if we have at least the required fields
-                required_fields = [f['name'] for f in current_fields if f['required']]
-                if all(field in item_data and item_data[field] for field in required_fields):
-                    try:
-                        item = Item(**item_data)
-                        inventory.add_item(item)
-                        imported_count += 1
-                    except Exception as e:
-                        print(f"Error creating item: {e}")
+        worker = threading.Thread(target=work, name="datasheet-import", daemon=True)
+        dialog = _import_progress_dialog(listbox, os.path.basename(file_path), cancel)
+        worker.start()
         
-        # Save to database and refresh
-        if imported_count > 0:
-            save_inventory_to_database()
-            # Reset to show all items after import
-            global filtered_items, current_page
-            current_page = 0
-            filtered_items = inventory.get_all_items()
-            refresh_listbox(listbox, filtered_items)
-            messagebox.showinfo("Import Complete", 
-                f"Successfully imported {imported_count} items.")
-        else:
-            messagebox.showwarning("Import", 
-                "No items could be imported. Check that your file has the required fields.")
+        def poll():
+            if worker.is_alive():
+                listbox.after(IMPORT_POLL_MS, poll)
+                return
+            dialog.grab_release()
+            dialog.destroy()
+            _finish_import(listbox, outcome, cancel.is_set())
+        
+        listbox.after(IMPORT_POLL_MS, poll)
     
     except Exception as e:
         messagebox.showerror("Import Error", f"Error importing file: {str(e)}")
 
+
+def _parse_datasheet(file_path, current_fields, cancel):
+    """
+    Parse a datasheet into new Items (runs on the import worker thread).
+    
+    Returns None when the file has no tables; stops early, returning the
+    items parsed so far, once `cancel` is set.
+    """
+    # Imported here so the parser stays off the startup path
+    from core.datasheet_importer import ingest_file
+    
+    tables = ingest_file(file_path)
+    if not tables:
+        return None
+    
+    required_fields = [f['name'] for f in current_fields if f['required']]
+    # (lowercased name, field name, converter) per field, for column matching
+    field_matches = [(f['name'].lower(), f['name'], _IMPORT_CONVERTERS.get(f['type']))
+                     for f in current_fields]
+    exact_matches = {match[0]: match for match in reversed(field_matches)}
+    imported_items = []
+    failed = 0
+    first_error = None
+    
+    for table_name, data in tables:
+        columns = data['columns']
+        rows = data['rows']
+        
+        # Try to map columns to current inventory fields - an exact name
+        # first, else the first similar name. Resolved once per table as
+        # (column index, field name, converter or None for text)
+        column_plan = []
+        for i, col in enumerate(columns):
+            col = col.lower()
+            match = exact_matches.get(col)
+            if match is None:
+                match = next((m for m in field_matches if col in m[0] or m[0] in col), None)
+            if match is not None:
+                column_plan.append((i, match[1], match[2]))
+        
+        # Import rows
+        for row in rows:
+            if cancel.is_set():
+                return imported_items
+            if len(row) != len(columns):
+                continue  # Skip malformed rows
+            
+            item_data = {}
+            for i, field_name, convert in column_plan:
+                value = row[i].strip() if row[i] else ""
+                if value and convert:
+                    try:
+                        value = convert(value)
+                    except ValueError:
+                        pass  # Keep as string if conversion fails
+                item_data[field_name] = value
+            
+            # Only create item if we have at least the required fields
+            if all(item_data.get(field) for field in required_fields):
+                try:
+                    imported_items.append(Item(**item_data))
+                except Exception as e:
+                    failed += 1
+                    if first_error is None:
+                        first_error = e
+    
+    if failed:
+        print(f"Could not create {failed} items; first error: {first_error}")
+    return imported_items
+
+
+def _import_progress_dialog(parent, file_name, cancel):
+    """Show a modal "importing" dialog whose Cancel button sets `cancel`."""
+    dialog = tk.Toplevel(parent)
+    dialog.title("Importing")
+    dialog.transient(parent.winfo_toplevel())
+    dialog.resizable(False, False)
+    
+    ttk.Label(dialog, text=f"Importing {file_name}...").pack(padx=20, pady=(15, 10))
+    progress = ttk.Progressbar(dialog, mode="indeterminate", length=250)
+    progress.pack(padx=20)
+    progress.start(10)
+    
+    def request_cancel():
+        cancel.set()
+        cancel_button.configure(state="disabled", text="Cancelling...")
+    
+    cancel_button = ttk.Button(dialog, text="Cancel", command=request_cancel)
+    cancel_button.pack(pady=(10, 15))
+    dialog.protocol("WM_DELETE_WINDOW", request_cancel)
+    
+    # Modal: no edits or type changes while the worker reads the fields
+    dialog.grab_set()
+    return dialog
+
+
+def _finish_import(listbox, outcome, cancelled):
+    """Apply a finished import on the UI thread."""
+    global filtered_items, current_page
+    
+    if 'error' in outcome:
+        messagebox.showerror("Import Error", f"Error importing file: {str(outcome['error'])}")
+        return
+    if cancelled:
+        messagebox.showinfo("Import", "Import cancelled. No items were added.")
+        return
+    
+    imported_items = outcome.get('items')
+    if imported_items is None:
+        messagebox.showwarning("Import", "No data found in the selected file.")
+        return
+    
+    imported_count = len(imported_items)
+    
+    # Add to the inventory and persist only the new rows, in one batch
+    if imported_count > 0:
+        inventory.bulk_add(imported_items)
+        if database:
+            queue_db_write(database.save_rows, [item.to_row() for item in imported_items],
+                           imported_count >= DEFER_INDEXES_MIN_ROWS,
+                           description="save the imported items")
+        # Reset to show all items after import
+        current_page = 0
+        filtered_items = inventory.get_all_items()
+        refresh_listbox(listbox, filtered_items)
+        messagebox.showinfo("Import Complete", 
+            f"Successfully imported {imported_count} items.")
+    else:
+        messagebox.showwarning("Import", 
+            "No items could be imported. Check that your file has the required fields.")
+
+ITEMS_TABLE = "items"
+
+_table_info_cache = {}  # (db_path, table) -> PRAGMA table_info rows
+
+def _cached_table_info(db, table):
+    """
+    Column info for `table` in `db`, queried once per (db_path, table) pair.
+    
+    Empty results (a missing table or a failed query) are not cached, so
+    they are retried next time.
+    """
+    key = (db.db_path, table)
+    info = _table_info_cache.get(key)
+    if info is None:
+        info = db.get_table_info(table)
+        if info:
+            _table_info_cache[key] = info
+    return info
+
 def view_database_tables():
     """Show database tables and their structure."""
     global database
@@ -736,163 +1295,172 @@ def view_database_tables():
         db_window.title("Database Structure")
         db_window.geometry("800x600")
         db_window.configure(bg="#F0F0F0")
+        loading = ttk.Label(db_window, text="Reading database...")
+        loading.pack(pady=20)
         
-        # Create notebook for tabs
-        notebook = ttk.Notebook(db_window)
-        notebook.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Tab 1: Tables Overview
-        tables_frame = ttk.Frame(notebook)
-        notebook.add(tables_frame, text="Tables")
-        
-        # Get tables from database
-        cursor = database.conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = cursor.fetchall()
-        
-        ttk.Label(tables_frame, text="Database Tables", font=("Segoe UI", 14, "bold")).pack(pady=10)
-        
-        # Create treeview for tables
-        tables_tree = ttk.Treeview(tables_frame, columns=('Table Name', 'Type'), show='headings', height=10)
-        tables_tree.heading('#1', text='Table Name')
-        tables_tree.heading('#2', text='Type')
-        tables_tree.column('#1', width=200)
-        tables_tree.column('#2', width=100)
+        # Query on a worker thread: the connection is shared with the
+        # background writer, which may hold it for a large import
+        db = database
+        outcome = {}
         
-        for table in tables:
-            tables_tree.insert('', 'end', values=(table[0], 'Table'))
-        
-        tables_tree.pack(expand=True, fill='both', padx=10, pady=10)
-        
-        # Tab 2: Current Table Structure
-        structure_frame = ttk.Frame(notebook)
-        notebook.add(structure_frame, text="Current Table Schema")
+        def work():
+            try:
+                outcome['info'] = (db.get_table_names(),
+                                   _cached_table_info(db, ITEMS_TABLE),
+                                   db.fetch_rows(ITEMS_TABLE, 5))
+            except Exception as e:
+                outcome['error'] = e
         
-        ttk.Label(structure_frame, text="Current Inventory Table Schema", font=("Segoe UI", 14, "bold")).pack(pady=10)
+        worker = threading.Thread(target=work, name="database-info", daemon=True)
+        worker.start()
         
-        # Get current table structure
-        cursor.execute("PRAGMA table_info(inventory_items);")
-        columns = cursor.fetchall()
+        # Polled from the main window, which outlives this one
+        main_window = db_window.master
         
-        # Create treeview for column info
-        cols_tree = ttk.Treeview(structure_frame, columns=('Column', 'Type', 'Required', 'Key'), show='headings', height=15)
-        cols_tree.heading('#1', text='Column Name')
-        cols_tree.heading('#2', text='Data Type')
-        cols_tree.heading('#3', text='Required')
-        cols_tree.heading('#4', text='Primary Key')
+        def poll():
+            if worker.is_alive():
+                main_window.after(LOAD_POLL_MS, poll)
+                return
+            if not db_window.winfo_exists():
+                return  # closed while the queries ran
+            if 'error' in outcome:
+                db_window.destroy()
+                messagebox.showerror("Database Error", f"Error viewing database structure: {str(outcome['error'])}")
+                return
+            loading.destroy()
+            _show_database_tables(db_window, *outcome['info'])
         
-        for col in columns:
-            cols_tree.insert('', 'end', values=(
-                col[1],  # name
-                col[2],  # type
-                'Yes' if col[3] else 'No',  # not null
-                'Yes' if col[5] else 'No'   # primary key
-            ))
+        main_window.after(LOAD_POLL_MS, poll)
         
-        cols_tree.pack(expand=True, fill='both', padx=10, pady=10)
+    except Exception as e:
+        messagebox.showerror("Database Error", f"Error viewing database structure: {str(e)}")
+
+def _show_database_tables(db_window, tables, columns, sample_data):
+    """Fill the database structure window with already-queried results."""
+    # Create notebook for tabs
+    notebook = ttk.Notebook(db_window)
+    notebook.pack(expand=True, fill='both', padx=10, pady=10)
+    
+    # Tab 1: Tables Overview
+    tables_frame = ttk.Frame(notebook)
+    notebook.add(tables_frame, text="Tables")
+    
+    ttk.Label(tables_frame, text="Database Tables", style="Title.TLabel").pack(pady=10)
+    
+    # Create treeview for tables
+    tables_tree = ttk.Treeview(tables_frame, columns=('Table Name', 'Type'), show='headings', height=10)
+    tables_tree.heading('#1', text='Table Name')
+    tables_tree.heading('#2', text='Type')
+    tables_tree.column('#1', width=200)
+    tables_tree.column('#2', width=100)
+    
+    for table in tables:
+        tables_tree.insert('', 'end', values=(table, 'Table'))
+    
+    tables_tree.pack(expand=True, fill='both', padx=10, pady=10)
+    
+    # Tab 2: Current Table Structure
+    structure_frame = ttk.Frame(notebook)
+    notebook.add(structure_frame, text="Current Table Schema")
+    
+    ttk.Label(structure_frame, text="Current Inventory Table Schema", style="Title.TLabel").pack(pady=10)
+    
+    # Create treeview for column info
+    cols_tree = ttk.Treeview(structure_frame, columns=('Column', 'Type', 'Required', 'Key'), show='headings', height=15)
+    cols_tree.heading('#1', text='Column Name')
+    cols_tree.heading('#2', text='Data Type')
+    cols_tree.heading('#3', text='Required')
+    cols_tree.heading('#4', text='Primary Key')
+    
+    for col in columns:
+        cols_tree.insert('', 'end', values=(
+            col[1],  # name
+            col[2],  # type
+            'Yes' if col[3] else 'No',  # not null
+            'Yes' if col[5] else 'No'   # primary key
+        ))
+    
+    cols_tree.pack(expand=True, fill='both', padx=10, pady=10)
+    
+    # Tab 3: Data Sample
+    data_frame = ttk.Frame(notebook)
+    notebook.add(data_frame, text="Sample Data")
+    
+    ttk.Label(data_frame, text="Sample Records", style="Title.TLabel").pack(pady=10)
+    
+    if sample_data:
+        column_names = [col[1] for col in columns]
         
-        # Tab 3: Data Sample
-        data_frame = ttk.Frame(notebook)
-        notebook.add(data_frame, text="Sample Data")
+        # Create treeview for sample data
+        data_tree = ttk.Treeview(data_frame, columns=column_names, show='headings', height=8)
         
-        ttk.Label(data_frame, text="Sample Records", font=("Segoe UI", 14, "bold")).pack(pady=10)
+        for col in column_names:
+            data_tree.heading(col, text=col)
+            data_tree.column(col, width=100)
         
-        # Get sample data
-        cursor.execute("SELECT * FROM inventory_items LIMIT 5;")
-        sample_data = cursor.fetchall()
+        for row in sample_data:
+            data_tree.insert('', 'end', values=row)
         
-        if sample_data:
-            # Get column names
-            cursor.execute("PRAGMA table_info(inventory_items);")
-            column_info = cursor.fetchall()
-            column_names = [col[1] for col in column_info]
-            
-            # Create treeview for sample data
-            data_tree = ttk.Treeview(data_frame, columns=column_names, show='headings', height=8)
-            
-            for col in column_names:
-                data_tree.heading(col, text=col)
-                data_tree.column(col, width=100)
-            
-            for row in sample_data:
-                data_tree.insert('', 'end', values=row)
-            
-            data_tree.pack(expand=True, fill='both', padx=10, pady=10)
-            
-            # Add scrollbars
-            v_scroll = ttk.Scrollbar(data_frame, orient="vertical", command=data_tree.yview)
-            v_scroll.pack(side="right", fill="y")
-            data_tree.config(yscrollcommand=v_scroll.set)
-            
-            h_scroll = ttk.Scrollbar(data_frame, orient="horizontal", command=data_tree.xview)
-            h_scroll.pack(side="bottom", fill="x")
-            data_tree.config(xscrollcommand=h_scroll.set)
-        else:
-            ttk.Label(data_frame, text="No sample data available").pack(pady=20)
+        data_tree.pack(expand=True, fill='both', padx=10, pady=10)
         
-        # Add close button
-        ttk.Button(db_window, text="Close", command=db_window.destroy).pack(pady=10)
+        # Add scrollbars
+        v_scroll = ttk.Scrollbar(data_frame, orient="vertical", command=data_tree.yview)
+        v_scroll.pack(side="right", fill="y")
+        data_tree.config(yscrollcommand=v_scroll.set)
         
-    except Exception as e:
-        messagebox.showerror("Database Error", f"Error viewing database structure: {str(e)}")
+        h_scroll = ttk.Scrollbar(data_frame, orient="horizontal", command=data_tree.xview)
+        h_scroll.pack(side="bottom", fill="x")
+        data_tree.config(xscrollcommand=h_scroll.set)
+    else:
+        ttk.Label(data_frame, text="No sample data available").pack(pady=20)
+    
+    # Add close button
+    ttk.Button(db_window, text="Close", command=db_window.destroy).pack(pady=10)
 
 def refresh_ui_after_type_change(new_type):
     """Refresh both the table and input fields after inventory type change."""
     global field_entries, listbox, input_frame
     
-    print(f"Refreshing UI for inventory type change to: {new_type.value}")
-    
     try:
         # Recreate input fields based on new type  
-        if 'input_frame' in globals() and input_frame:
-            print("Updating input fields...")
+        if input_frame:
             create_input_fields(input_frame)
         
         # Recreate table columns based on new type
-        if 'listbox' in globals() and listbox:
-            print("Updating table columns...")
-            # Get new fields configuration
-            fields = get_inventory_fields()
-            print(f"New fields: {[f['name'] for f in fields]}")
-            
-            # Clear existing items first
-            for item in listbox.get_children():
-                listbox.delete(item)
-            
-            # Reconfigure table columns
-            new_columns = ['#'] + [field['name'].title() for field in fields]
-            listbox['columns'] = new_columns
+        if listbox:
+            # Clear existing items first, in a single Tcl call
+            children = listbox.get_children()
+            if children:
+                listbox.delete(*children)
             
-            # Reconfigure column headings and widths
-            listbox.heading('#1', text='#')
-            listbox.column('#1', width=40, anchor='center')
+            # Reconfigure table columns, headings and widths
+            listbox['columns'] = _table_columns()
+            _configure_columns(listbox)
+            _apply_hidden_columns(listbox)
             
-            for i, field in enumerate(fields, 1):
-                col_name = field['name'].replace('_', ' ').title()
-                listbox.heading(f'#{i+1}', text=col_name)
-                width = max(100, len(col_name) * 10 + 20)
-                listbox.column(f'#{i+1}', width=width, anchor='w')
-            
-            print("Reloading data from database with new schema...")
             # Reload data from database with new field schema
             load_inventory_from_database()
             
             # Refresh table data
-            print("Refreshing table display...")
             refresh_listbox(listbox, filtered_items)
-            
-            # Force UI update
-            listbox.update_idletasks()
-            
-        print("UI refresh complete!")
         
     except Exception as e:
         print(f"Error during UI refresh: {e}")
         messagebox.showerror("UI Error", f"Error refreshing interface: {str(e)}")
 
+_type_dialog = None  # (dialog, selected type variable), built on first use and then reused
+
 def change_inventory_type():
     """Allow user to change inventory type."""
-    global field_entries
+    global field_entries, _type_dialog
+    
+    # Reopen the hidden dialog, preselecting the current type
+    if _type_dialog is not None and _type_dialog[0].winfo_exists():
+        dialog, selected_type = _type_dialog
+        selected_type.set(get_inventory_type())
+        dialog.deiconify()
+        dialog.grab_set()  # Make it modal
+        return
     
     # Create dialog for inventory type selection
     dialog = tk.Toplevel()
@@ -900,11 +1468,11 @@ def change_inventory_type():
     dialog.geometry("400x300")
     dialog.grab_set()  # Make it modal
     
-    ttk.Label(dialog, text="Select Inventory Type:", font=("Segoe UI", 12, "bold")).pack(pady=10)
+    ttk.Label(dialog, text="Select Inventory Type:", style="Subtitle.TLabel").pack(pady=10)
     
     # Get available types
     types = get_inventory_types()
-    selected_type = tk.StringVar(value=get_inventory_type())
+    selected_type = tk.StringVar(dialog, value=get_inventory_type())
     
     for inv_type in types:
         ttk.Radiobutton(
@@ -914,24 +1482,30 @@ def change_inventory_type():
             value=inv_type['id']
         ).pack(anchor="w", padx=20, pady=5)
     
+    def close():
+        # Hidden rather than destroyed, so the next open is instant
+        dialog.grab_release()
+        dialog.withdraw()
+    
     def apply_change():
         new_type_str = selected_type.get()
-        for inv_type in InventoryType:
-            if inv_type.value == new_type_str:
-                set_inventory_type(inv_type)
-                from core.config import save_config
-                save_config(inv_type)
-                
-                # Dynamically recreate input fields and refresh display
-                refresh_ui_after_type_change(inv_type)
-                messagebox.showinfo("Type Changed", 
-                    f"Inventory type changed to {inv_type.value.title()}.\n"
-                    "Form fields and table have been updated!")
-                break
-        dialog.destroy()
+        if new_type_str != get_inventory_type():
+            inv_type = InventoryType(new_type_str)  # Enum lookup by value
+            set_inventory_type(inv_type)
+            _invalidate_fields_cache()
+            save_config(inv_type)
+            
+            # Dynamically recreate input fields and refresh display
+            refresh_ui_after_type_change(inv_type)
+            messagebox.showinfo("Type Changed", 
+                f"Inventory type changed to {inv_type.value.title()}.\n"
+                "Form fields and table have been updated!")
+        close()
     
     ttk.Button(dialog, text="Apply", command=apply_change).pack(pady=10)
-    ttk.Button(dialog, text="Cancel", command=dialog.destroy).pack()
+    ttk.Button(dialog, text="Cancel", command=close).pack()
+    dialog.protocol("WM_DELETE_WINDOW", close)
+    _type_dialog = (dialog, selected_type)
 
 def clear_all_data(listbox):
     """Clear all inventory data."""
@@ -951,7 +1525,7 @@ def clear_all_data(listbox):
             try:
                 # Clear database
                 if database:
-                    database.clear_items()
+                    queue_db_write(database.clear_items, description="clear the database")
                 
                 # Clear in-memory inventory
                 inventory = Inventory()
@@ -979,11 +1553,11 @@ def reset_to_default(listbox):
         try:
             # Clear database
             if database:
-                database.clear_items()
+                queue_db_write(database.clear_items, description="clear the database")
             
             # Reset inventory type
             set_inventory_type(InventoryType.WAREHOUSE)
-            from core.config import save_config
+            _invalidate_fields_cache()
             save_config(InventoryType.WAREHOUSE)
             
             # Clear in-memory inventory
@@ -1000,6 +1574,28 @@ def reset_to_default(listbox):
         except Exception as e:
             messagebox.showerror("Error", f"Error resetting system: {str(e)}")
 
+def _build_menu(menubar, label, entries):
+    """Add a cascade to `menubar` from (label, command) entries; None adds a separator."""
+    menu = tk.Menu(menubar)
+    menubar.add_cascade(label=label, menu=menu)
+    add_command = menu.add_command
+    for entry in entries:
+        if entry is None:
+            menu.add_separator()
+        else:
+            add_command(label=entry[0], command=entry[1])
+    return menu
+
+
+def _pack_buttons(parent, entries):
+    """Stack full-width buttons from (text, command) entries; None adds a separator."""
+    for entry in entries:
+        if entry is None:
+            ttk.Separator(parent, orient="horizontal").pack(fill="x", pady=10)
+        else:
+            ttk.Button(parent, text=entry[0], command=entry[1]).pack(fill="x", pady=2)
+
+
 def run_gui():
     """Initialize and run the flexible inventory GUI."""
     global field_entries, database, input_frame, listbox
@@ -1007,48 +1603,26 @@ def run_gui():
     # Initialize inventory setup
     initialize_inventory_setup()
     
-    # Initialize database
+    # Initialize database; items are loaded once the window exists
     database = Database()
-    load_inventory_from_database()
     
     root = tk.Tk()
-    root.title("Inventory Management System")
+    # Keep the window hidden while it is built so the geometry is computed
+    # once for the finished layout instead of after every pack()
+    root.withdraw()
+    # No tear-off entry on any menu, so menus are created without one
+    root.option_add('*tearOff', False)
+    _set_window_title(root)
     root.geometry("1200x800")
     root.configure(bg="#F0F0F0")  # Light gray background
     root.minsize(1000, 600)  # Minimum window size
     
     setup_styles()
     
-    # Create menu bar with better styling
-    menubar = tk.Menu(root, bg="#E1E1E1", fg="#000000", activebackground="#4A90E2", activeforeground="#FFFFFF")
-    root.config(menu=menubar)
-    
-    # File menu
-    file_menu = tk.Menu(menubar, tearoff=0)
-    menubar.add_cascade(label="File", menu=file_menu)
-    file_menu.add_command(label="Import Datasheet...", command=lambda: import_datasheet(listbox))
-    file_menu.add_separator()
-    file_menu.add_command(label="Choose Database...", command=lambda: choose_database(root, listbox))
-    file_menu.add_separator()
-    file_menu.add_command(label="Exit", command=root.quit)
-    
-    # Tools menu
-    tools_menu = tk.Menu(menubar, tearoff=0)
-    menubar.add_cascade(label="Tools", menu=tools_menu)
-    tools_menu.add_command(label="Change Inventory Type...", command=change_inventory_type)
-    tools_menu.add_separator()
-    tools_menu.add_command(label="View Database Tables...", command=view_database_tables)
-    tools_menu.add_separator()
-    tools_menu.add_command(label="Clear All Data...", command=lambda: clear_all_data(listbox))
-    tools_menu.add_command(label="Reset to Default...", command=lambda: reset_to_default(listbox))
-    
     # Main container
     main_frame = ttk.Frame(root, padding="10")
     main_frame.pack(expand=True, fill="both")
     
-    # Create a placeholder listbox variable that we'll update later
-    listbox = None
-    
     # Top frame with database and inventory type info
     top_frame = ttk.Frame(main_frame)
     top_frame.pack(fill="x", pady=(0, 10))
@@ -1070,27 +1644,46 @@ def run_gui():
     
     ttk.Label(left_frame, text="Inventory Data").pack(anchor="w", pady=(0, 5))
     
+    # Search box - filters the table as the user types
+    search_frame = ttk.Frame(left_frame)
+    search_frame.pack(fill="x", pady=(0, 5))
+    ttk.Label(search_frame, text="Search:").pack(side="left")
+    search_entry = ttk.Entry(search_frame)
+    search_entry.pack(side="left", expand=True, fill="x")
+    
+    # Debounce keystrokes: only the last key in a burst triggers a search
+    search_after_id = [None]
+    
+    def run_search():
+        search_after_id[0] = None
+        search_items(search_entry, listbox)
+    
+    def schedule_search(event=None):
+        if search_after_id[0]:
+            root.after_cancel(search_after_id[0])
+        search_after_id[0] = root.after(SEARCH_DEBOUNCE_MS, run_search)
+    
+    search_entry.bind("<KeyRelease>", schedule_search)
+    
     # Create table frame
     table_frame = ttk.Frame(left_frame)
     table_frame.pack(expand=True, fill="both")
     
     # Create Treeview for table display
-    fields = get_inventory_fields()
-    columns = ['#'] + [field['name'].title() for field in fields]  # Show ALL fields + index
+    columns = _table_columns()  # Show ALL fields + index
     
     listbox = ttk.Treeview(table_frame, columns=columns, show='headings', height=15)
     
-    # Configure column headings and widths
-    listbox.heading('#1', text='#')
-    listbox.column('#1', width=40, anchor='center')
-    
-    # Configure ALL field columns dynamically
-    for i, field in enumerate(fields, 1):
-        col_name = field['name'].replace('_', ' ').title()
-        listbox.heading(f'#{i+1}', text=col_name)
-        # Adjust width based on field type and name length
-        width = max(100, len(col_name) * 10 + 20)
-        listbox.column(f'#{i+1}', width=width, anchor='w')
+    # Configure column headings and widths for ALL field columns; which of
+    # them are displayed is toggled from a right-click menu on the headings
+    _configure_columns(listbox)
+    show_column_menu = partial(_show_column_menu, table=listbox)
+    if root.tk.call("tk", "windowingsystem") == "aqua":
+        # macOS reports the right button as Button-2, or Control-click
+        listbox.bind("<Button-2>", show_column_menu)
+        listbox.bind("<Control-Button-1>", show_column_menu)
+    else:
+        listbox.bind("<Button-3>", show_column_menu)
     
     listbox.pack(side="left", expand=True, fill="both")
     
@@ -1099,10 +1692,10 @@ def run_gui():
     pagination_frame.pack(fill="x", pady=(5, 0))
     
     ttk.Button(pagination_frame, text="◀ Prev", 
-               command=lambda: prev_page(listbox)).pack(side="left", padx=(0, 5))
+               command=partial(prev_page, listbox)).pack(side="left", padx=(0, 5))
     
     ttk.Button(pagination_frame, text="Next ▶", 
-               command=lambda: next_page(listbox)).pack(side="left", padx=(0, 10))
+               command=partial(next_page, listbox)).pack(side="left", padx=(0, 10))
     
     # Items per page selector
     ttk.Label(pagination_frame, text="Items per page:").pack(side="left", padx=(0, 5))
@@ -1123,11 +1716,37 @@ def run_gui():
     h_scrollbar.pack(side="bottom", fill="x")
     listbox.config(xscrollcommand=h_scrollbar.set)
     
-    # Now that listbox is created, connect the toolbar buttons
+    # Now that listbox is created, bind the commands shared by the menus
+    # and buttons once
+    import_command = partial(import_datasheet, listbox)
+    choose_database_command = partial(choose_database, root, listbox)
+    clear_all_command = partial(clear_all_data, listbox)
+    reset_command = partial(reset_to_default, listbox)
+    
+    # Create menu bar with better styling
+    menubar = tk.Menu(root, bg="#E1E1E1", fg="#000000", activebackground="#4A90E2", activeforeground="#FFFFFF")
+    root.config(menu=menubar)
+    
+    # Menus are described as (label, command) entries; None is a separator
+    _build_menu(menubar, "File", (
+        ("Import Datasheet...", import_command),
+        ("Choose Database...", choose_database_command),
+        None,
+        ("Exit", root.quit),
+    ))
+    _build_menu(menubar, "Tools", (
+        ("Change Inventory Type...", change_inventory_type),
+        ("View Database Tables...", view_database_tables),
+        None,
+        ("Clear All Data...", clear_all_command),
+        ("Reset to Default...", reset_command),
+    ))
+    
+    # Toolbar buttons
     ttk.Button(
         toolbar_frame,
         text="Import Data",
-        command=lambda: import_datasheet(listbox)
+        command=import_command
     ).pack(side="left", padx=(0, 5))
     
     ttk.Button(
@@ -1139,7 +1758,7 @@ def run_gui():
     ttk.Button(
         toolbar_frame,
         text="Database",
-        command=lambda: choose_database(root, listbox)
+        command=choose_database_command
     ).pack(side="left")
     
     # Right side - Input form
@@ -1159,58 +1778,47 @@ def run_gui():
     buttons_frame = ttk.Frame(right_frame)
     buttons_frame.pack(fill="x", pady=(10, 0))
     
-    ttk.Button(
-        buttons_frame,
-        text="Add Item",
-        command=lambda: add_item(listbox)
-    ).pack(fill="x", pady=2)
-    
-    ttk.Button(
-        buttons_frame,
-        text="Update Item",
-        command=lambda: update_item(listbox)
-    ).pack(fill="x", pady=2)
-    
-    ttk.Button(
-        buttons_frame,
-        text="Delete Item",
-        command=lambda: delete_item(listbox)
-    ).pack(fill="x", pady=2)
-    
-    ttk.Button(
-        buttons_frame,
-        text="Clear Fields",
-        command=clear_entries
-    ).pack(fill="x", pady=2)
-    
-    # Separator
-    ttk.Separator(buttons_frame, orient="horizontal").pack(fill="x", pady=10)
-    
-    # Data management buttons
-    ttk.Label(buttons_frame, text="Data Management", font=("Segoe UI", 9, "bold")).pack(anchor="w")
-    
-    ttk.Button(
-        buttons_frame,
-        text="Clear All Data",
-        command=lambda: clear_all_data(listbox)
-    ).pack(fill="x", pady=2)
-    
-    ttk.Button(
-        buttons_frame,
-        text="Reset System",
-        command=lambda: reset_to_default(listbox)
-    ).pack(fill="x", pady=2)
-    
-    # Bind item selection event
-    listbox.bind(
-        "<<TreeviewSelect>>",
-        lambda event: on_item_select(event, listbox)
-    )
-    
-    # Load initial data - start with all items
-    refresh_listbox(listbox)
-    
+    # Item actions, then the data management section; as with the menus,
+    # None is a separator
+    _pack_buttons(buttons_frame, (
+        ("Add Item", partial(add_item, listbox)),
+        ("Update Item", partial(update_item, listbox)),
+        ("Delete Item", partial(delete_item, listbox)),
+        ("Clear Fields", clear_entries),
+        None,
+    ))
+    ttk.Label(buttons_frame, text="Data Management", style="Section.TLabel").pack(anchor="w")
+    _pack_buttons(buttons_frame, (
+        ("Clear All Data", clear_all_command),
+        ("Reset System", reset_command),
+    ))
+    
+    # Bind item selection event, debounced so holding an arrow key or
+    # dragging a selection fills the form once, for the final row
+    select_after_id = [None]
+    
+    def run_select():
+        select_after_id[0] = None
+        on_item_select(None, listbox)
+    
+    def schedule_select(event=None):
+        if select_after_id[0]:
+            root.after_cancel(select_after_id[0])
+        select_after_id[0] = root.after(SELECT_DEBOUNCE_MS, run_select)
+    
+    listbox.bind("<<TreeviewSelect>>", schedule_select)
+    
+    # Load initial data off the UI thread; the table fills in when it is read
+    load_inventory_in_background(listbox)
+    
+    root.after(100, _report_db_errors, root)
+    root.update_idletasks()
+    root.deiconify()
     root.mainloop()
+    
+    # Don't lose writes still queued when the window closes
+    flush_db_writes()
+    database.close()
 
 
 if __name__ == "__main__":
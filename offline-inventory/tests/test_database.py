@@ -0,0 +1,103 @@
+# tests/test_database.py
+
+import pytest
+from db.database import Database
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = Database(str(tmp_path / "inventory.db"))
+    db.save_item({'id': 'a1', 'created_at': '2025-01-01T00:00:00',
+                  'updated_at': '2025-01-01T00:00:00',
+                  'name': 'Laptop', 'quantity': 5, 'price': 800.0})
+    db.save_item({'id': 'b2', 'created_at': '2025-01-01T00:00:00',
+                  'updated_at': '2025-01-01T00:00:00',
+                  'name': 'Mouse', 'quantity': 10, 'price': 5.5})
+    return db
+
+
+def test_schema_recreated_after_file_removed(tmp_path):
+    db_file = tmp_path / "fresh.db"
+    Database(str(db_file))
+    db_file.unlink()
+    db = Database(str(db_file))
+    assert db.save_item({'id': 'x', 'created_at': 'now', 'updated_at': 'now'})
+
+
+def test_delete_item(database):
+    assert database.delete_item('a1')
+    assert [item['id'] for item in database.get_all_items()] == ['b2']
+
+
+def test_save_rows_from_generator(tmp_path):
+    db = Database(str(tmp_path / "stream.db"))
+    produced = (
+        (f'g{i}', 'now', 'now', f'{{"id": "g{i}", "name": "Row {i}"}}')
+        for i in range(1000)
+    )
+    assert db.save_rows(produced)
+    assert len(db.get_all_items()) == 1000
+
+
+def test_database_uses_wal(database):
+    with database._transaction() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_table_introspection(database):
+    assert "items" in database.get_table_names()
+    assert database.get_column_names("items") == ("id", "created_at", "updated_at", "data")
+    assert len(database.fetch_rows("items", 1)) == 1
+
+
+def test_connection_reused_across_calls(database):
+    database.item_exists('a1')
+    conn = database._conn
+    database.save_item({'id': 'c3', 'created_at': 'now', 'updated_at': 'now'})
+    assert database._conn is conn
+    database.close()
+    assert len(database.get_all_items()) == 3
+
+
+def test_save_rows_rolls_back_on_error(database):
+    rows = [('c3', 'now', 'now', '{"id": "c3"}'), ('d4', 'now', 'now')]
+    assert not database.save_rows(rows)  # second row is missing its data column
+    assert sorted(item['id'] for item in database.get_all_items()) == ['a1', 'b2']
+
+
+def test_save_rows_upserts(database):
+    assert database.save_rows([
+        ('a1', 'now', 'now', '{"id": "a1", "name": "Desktop"}'),
+        ('c3', 'now', 'now', '{"id": "c3", "name": "Monitor"}'),
+    ])
+    assert sorted(item['name'] for item in database.get_all_items()) == ['Desktop', 'Monitor', 'Mouse']
+
+
+def test_save_rows_deferring_indexes(database):
+    with database._transaction() as conn:
+        conn.execute("CREATE INDEX idx_items_name ON items (json_extract(data, '$.name'))")
+    rows = [(f'r{i}', 'now', 'now', f'{{"id": "r{i}", "name": "Row {i}"}}') for i in range(100)]
+    assert database.save_rows(rows, defer_indexes=True)
+    assert len(database.get_all_items()) == 102
+    with database._transaction() as conn:
+        names = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")]
+    assert "idx_items_name" in names
+
+
+def test_iter_items_in_batches(database):
+    names = sorted(item['name'] for item in database.iter_items(batch_size=1))
+    assert names == ['Laptop', 'Mouse']
+
+
+def test_iter_items_releases_lock_between_batches(database):
+    items = database.iter_items(batch_size=1)
+    first = next(items)
+    assert not database._lock.locked()
+    assert database.save_row(('c3', 'now', 'now', '{"id": "c3", "name": "Monitor"}'))
+    assert sorted([first['name']] + [item['name'] for item in items]) == ['Laptop', 'Monitor', 'Mouse']
+
+
+def test_save_row(database):
+    assert database.save_row(('a1', 'now', 'now', '{"id": "a1", "name": "Desktop"}'))
+    assert len(database.get_all_items()) == 2
+    assert 'Desktop' in [item['name'] for item in database.get_all_items()]
@@ -0,0 +1,400 @@
+# tests/test_gui.py
+
+import queue
+
+import pytest
+from core.config import set_inventory_type, InventoryType
+from core.inventory import Inventory, Item
+from db.database import Database
+from gui import gui
+
+
+class FakeTable:
+    """Stands in for the Treeview: keeps rows in a dict and collects after() callbacks."""
+
+    def __init__(self):
+        self.scheduled = []
+        self.rows = {}  # iid -> list of cell values
+        self.order = []
+        self.inserted = []
+        self.selected = ()
+
+    def after(self, ms, callback, *args):
+        job = (callback, args)
+        self.scheduled.append(job)
+        return job
+
+    def after_cancel(self, job):
+        self.scheduled.remove(job)
+
+    def cget(self, option):
+        return ''
+
+    def configure(self, **options):
+        pass
+
+    def insert(self, parent, index, iid, values):
+        assert iid not in self.rows
+        self.rows[iid] = list(values)
+        self.order.insert(len(self.order) if index == 'end' else index, iid)
+        self.inserted.append(iid)
+
+    def get_children(self):
+        return tuple(self.order)
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.order.remove(iid)
+            del self.rows[iid]
+
+    def exists(self, iid):
+        return iid in self.rows
+
+    def set(self, iid, column, value=None):
+        if value is None:
+            return self.rows[iid][0]
+        self.rows[iid][0] = value
+
+    def item(self, iid, values):
+        self.rows[iid] = list(values)
+
+    def selection(self):
+        return self.selected
+
+    def winfo_toplevel(self):
+        return self
+
+    def title(self, text):
+        pass
+
+    def shown(self):
+        """(row number, name) per row, top to bottom."""
+        name = gui._field_names().index("name") + 1
+        return [(self.rows[iid][0], self.rows[iid][name]) for iid in self.order]
+
+
+def run_scheduled(table):
+    """Run queued after() callbacks until none are left (polls included)."""
+    while table.scheduled:
+        callback, args = table.scheduled.pop(0)
+        callback(*args)
+
+
+@pytest.fixture
+def stored_database(tmp_path, monkeypatch):
+    set_inventory_type(InventoryType.WAREHOUSE)
+    gui._invalidate_fields_cache()
+    db = Database(str(tmp_path / "startup.db"))
+    assert db.save_row(Item(name="Laptop", quantity=5, price=800, sku="LAP001").to_row())
+    monkeypatch.setattr(gui, "database", db)
+    monkeypatch.setattr(gui, "inventory", Inventory())
+    monkeypatch.setattr(gui, "refresh_listbox", lambda table, items=None: None)
+    yield db
+    set_inventory_type(InventoryType.WAREHOUSE)
+    gui._invalidate_fields_cache()
+
+
+def test_background_load_installs_items(stored_database):
+    table = FakeTable()
+    gui.load_inventory_in_background(table)
+    run_scheduled(table)
+    assert [item.name for item in gui.inventory.get_all_items()] == ["Laptop"]
+
+
+def test_background_load_dropped_after_database_switch(stored_database, tmp_path):
+    table = FakeTable()
+    gui.load_inventory_in_background(table)
+
+    # Choose Database finishes before the startup load is installed
+    gui.database = Database(str(tmp_path / "other.db"))
+    switched = gui.inventory = Inventory()
+    switched.add_item(Item(name="Mouse", quantity=1, price=5, sku="MSE001"))
+    run_scheduled(table)
+
+    assert gui.inventory is switched
+    assert [item.name for item in gui.inventory.get_all_items()] == ["Mouse"]
+
+
+def test_background_load_dropped_after_clear(stored_database):
+    table = FakeTable()
+    gui.load_inventory_in_background(table)
+
+    cleared = gui.inventory = Inventory()  # Clear All Data
+    run_scheduled(table)
+
+    assert gui.inventory is cleared
+    assert len(gui.inventory) == 0
+
+
+def test_background_load_dropped_after_type_change(stored_database):
+    table = FakeTable()
+    gui.load_inventory_in_background(table)
+
+    set_inventory_type(InventoryType.LIBRARY)  # Change Inventory Type
+    gui._invalidate_fields_cache()
+    run_scheduled(table)
+
+    assert len(gui.inventory) == 0
+
+
+def test_table_info_cached_per_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(gui, "_table_info_cache", {})
+    first = Database(str(tmp_path / "first.db"))
+    second = Database(str(tmp_path / "second.db"))
+    with second._transaction() as conn:
+        conn.execute("CREATE TABLE extra (sku TEXT)")
+
+    assert [col[1] for col in gui._cached_table_info(second, "extra")] == ["sku"]
+    assert gui._cached_table_info(first, "extra") == ()  # missing here
+    assert (first.db_path, "extra") not in gui._table_info_cache
+
+    with first._transaction() as conn:
+        conn.execute("CREATE TABLE extra (code TEXT)")
+    assert [col[1] for col in gui._cached_table_info(first, "extra")] == ["code"]
+
+
+class Dialogs:
+    """Stands in for tkinter.messagebox, answering yes to every question."""
+
+    def showinfo(self, *args):
+        pass
+
+    showwarning = showerror = showinfo
+
+    def askyesno(self, *args):
+        return True
+
+
+@pytest.fixture
+def table_view(monkeypatch):
+    set_inventory_type(InventoryType.WAREHOUSE)
+    gui._invalidate_fields_cache()
+    monkeypatch.setattr(gui, "inventory", Inventory())
+    monkeypatch.setattr(gui, "database", None)
+    monkeypatch.setattr(gui, "filtered_items", [])
+    monkeypatch.setattr(gui, "current_page", 0)
+    monkeypatch.setattr(gui, "items_per_page", 3)
+    monkeypatch.setattr(gui, "_fill_job", None)
+    monkeypatch.setattr(gui, "_row_keys", {})
+    monkeypatch.setattr(gui, "messagebox", Dialogs())
+    monkeypatch.setattr(gui, "clear_entries", lambda: None)
+    monkeypatch.setattr(gui, "field_entries", {"name": None})  # form is built
+    refreshes = []
+    refresh_listbox = gui.refresh_listbox
+    def counting_refresh(table, items=None):
+        refreshes.append(items)
+        refresh_listbox(table, items)
+    monkeypatch.setattr(gui, "refresh_listbox", counting_refresh)
+    table = FakeTable()
+    table.refreshes = refreshes
+    return table
+
+
+def add(table, monkeypatch, name):
+    """Add an item through the Add button's handler."""
+    monkeypatch.setattr(gui, "_read_entries", lambda: {"name": name, "quantity": 1, "price": 1})
+    gui.add_item(table)
+    return next(item for item in gui.inventory.get_all_items() if item.name == name)
+
+
+def delete(table, item):
+    """Delete an item through the Delete button's handler."""
+    table.selected = (item.id,)
+    gui.delete_item(table)
+
+
+def test_add_after_delete_appends_row(table_view, monkeypatch):
+    laptop = add(table_view, monkeypatch, "Laptop")
+    add(table_view, monkeypatch, "Mouse")
+    delete(table_view, laptop)
+    del table_view.refreshes[:]
+
+    add(table_view, monkeypatch, "Cable")
+
+    assert table_view.refreshes == []  # appended, no full refresh
+    assert gui.filtered_items is gui.inventory.get_all_items()
+    assert table_view.shown() == [("1", "Mouse"), ("2", "Cable")]
+
+
+def test_add_while_page_is_filling(table_view, monkeypatch):
+    monkeypatch.setattr(gui, "items_per_page", 10)
+    monkeypatch.setattr(gui, "RENDER_FIRST_ROWS", 2)
+    gui.inventory.bulk_add(Item(name=name, quantity=1, price=1) for name in ("A", "B", "C", "D"))
+    gui.refresh_listbox(table_view, gui.inventory.get_all_items())
+    assert gui._fill_job is not None
+
+    add(table_view, monkeypatch, "E")
+    run_scheduled(table_view)
+
+    assert gui._fill_job is None
+    assert table_view.shown() == [(str(n), name) for n, name in enumerate("ABCDE", 1)]
+
+
+def test_delete_on_filtered_view(table_view):
+    items = [Item(name=name, quantity=1, price=1) for name in ("A", "B", "C", "D", "E")]
+    gui.inventory.bulk_add(items)
+    _, b, c, d, _ = items
+    gui.items_per_page = 2
+    gui.refresh_listbox(table_view, [b, c, d])  # e.g. a search result
+    del table_view.refreshes[:]
+
+    delete(table_view, b)
+
+    assert table_view.refreshes == []
+    assert gui.filtered_items == [c, d]
+    assert table_view.shown() == [("1", "C"), ("2", "D")]
+
+
+def test_update_row_keeps_number(table_view):
+    items = [Item(name=name, quantity=1, price=1) for name in ("A", "B")]
+    gui.inventory.bulk_add(items)
+    gui.refresh_listbox(table_view, gui.inventory.get_all_items())
+
+    gui.inventory.update_item(items[1].id, {"name": "Z"})
+    gui._update_row(table_view, items[1])
+
+    assert table_view.shown() == [("1", "A"), ("2", "Z")]
+
+
+def test_refresh_reuses_rows_still_shown(table_view):
+    items = [Item(name=name, quantity=1, price=1) for name in ("A", "B", "C", "D")]
+    gui.inventory.bulk_add(items)
+    a, b, c, d = items
+    gui.refresh_listbox(table_view, [a, b, c])
+    del table_view.inserted[:]
+
+    gui.refresh_listbox(table_view, [b, c, d])
+
+    assert table_view.inserted == [d.id]
+    assert table_view.shown() == [("1", "B"), ("2", "C"), ("3", "D")]
+
+
+def row(item_id):
+    return (item_id, 'now', 'now', f'{{"id": "{item_id}"}}')
+
+
+def save(db, item_id):
+    """A queued save_row() write, as queue_db_write() stores it."""
+    return (db.save_row, (row(item_id),), "save the item")
+
+
+def apply_writes(writes):
+    for operation, args, description in gui._coalesce_writes(writes):
+        gui._apply_write(operation, args, description)
+
+
+def stored_ids(db):
+    return sorted(item['id'] for item in db.get_all_items())
+
+
+@pytest.fixture
+def write_errors(monkeypatch):
+    errors = queue.Queue()
+    monkeypatch.setattr(gui, "_db_errors", errors)
+    return errors
+
+
+def test_coalesce_keeps_order_around_deletes_and_clears(tmp_path, write_errors):
+    db = Database(str(tmp_path / "writes.db"))
+    delete = (db.delete_item, ('a1',), "delete the item")
+    clear = (db.clear_items, (), "clear the database")
+    writes = [save(db, 'a1'), save(db, 'b2'), delete, save(db, 'c3'),
+              clear, save(db, 'd4'), save(db, 'e5')]
+
+    merged = gui._coalesce_writes(writes)
+
+    assert [description for _, _, description in merged] == [
+        "save 2 items", "delete the item", "save the item", "clear the database", "save 2 items"]
+    assert merged[1] is delete and merged[2] is writes[3] and merged[3] is clear
+    apply_writes(writes)
+    assert stored_ids(db) == ['d4', 'e5']
+    assert write_errors.empty()
+
+
+def test_coalesce_groups_saves_per_database(tmp_path, write_errors):
+    first = Database(str(tmp_path / "first.db"))
+    second = Database(str(tmp_path / "second.db"))
+    writes = [save(first, 'a1'), save(second, 'b2'), save(second, 'c3'), save(first, 'd4')]
+
+    merged = gui._coalesce_writes(writes)
+
+    assert [description for _, _, description in merged] == ["save the item", "save 2 items", "save the item"]
+    apply_writes(writes)
+    assert stored_ids(first) == ['a1', 'd4']
+    assert stored_ids(second) == ['b2', 'c3']
+
+
+def test_coalesce_passes_single_write_through(tmp_path):
+    db = Database(str(tmp_path / "single.db"))
+    writes = [save(db, 'a1')]
+    assert gui._coalesce_writes(writes) == writes
+
+
+def test_merged_save_falls_back_to_single_rows(tmp_path, write_errors):
+    db = Database(str(tmp_path / "fallback.db"))
+    bad = (db.save_row, (('x9', 'now', 'now'),), "save the item")  # missing its data column
+    apply_writes([save(db, 'a1'), bad, save(db, 'b2')])
+
+    assert stored_ids(db) == ['a1', 'b2']
+    assert write_errors.get_nowait() == "Could not save the item (item x9)."
+    assert write_errors.empty()
+
+
+class FakeMenu:
+    def __init__(self, master):
+        self.labels = []
+        self.popups = 0
+        self.destroyed = False
+
+    def add_checkbutton(self, label, variable, command):
+        self.labels.append(label)
+
+    def tk_popup(self, x, y):
+        self.popups += 1
+
+    def destroy(self):
+        self.destroyed = True
+
+
+class FakeVar:
+    def __init__(self, master):
+        self.value = None
+
+    def set(self, value):
+        self.value = value
+
+
+class HeadingClick:
+    x = y = x_root = y_root = 0
+
+
+class HeadingTable(FakeTable):
+    def identify_region(self, x, y):
+        return "heading"
+
+
+def test_column_menu_reused_between_popups(monkeypatch):
+    set_inventory_type(InventoryType.WAREHOUSE)
+    gui._invalidate_fields_cache()
+    monkeypatch.setattr(gui.tk, "Menu", FakeMenu)
+    monkeypatch.setattr(gui.tk, "BooleanVar", FakeVar)
+    monkeypatch.setattr(gui, "_column_menu", None)
+    monkeypatch.setattr(gui, "_hidden_columns", set())
+    table = HeadingTable()
+
+    gui._show_column_menu(HeadingClick(), table)
+    _, _, menu, variables = gui._column_menu
+    gui._hidden_columns.add(gui._field_names()[0])
+    gui._show_column_menu(HeadingClick(), table)
+
+    assert gui._column_menu[2] is menu and menu.popups == 2
+    assert [var.value for var in variables][:2] == [False, True]
+
+    set_inventory_type(InventoryType.LIBRARY)  # other fields: rebuild
+    gui._invalidate_fields_cache()
+    try:
+        gui._show_column_menu(HeadingClick(), table)
+    finally:
+        set_inventory_type(InventoryType.WAREHOUSE)
+        gui._invalidate_fields_cache()
+    assert menu.destroyed and gui._column_menu[2] is not menu
@@ -1,6 +1,9 @@
 # tests/test_inventory.py
 
+import json
+
 import pytest
+from core.config import set_inventory_type, InventoryType
 from core.inventory import Inventory, Item
 from core import datasheet_importer
 
@@ -25,10 +28,12 @@ def test_supported_extensions():
 
 
 @pytest.fixture
-def sample_inventory():
-    from core.config import set_inventory_type, InventoryType
+def warehouse_type():
     set_inventory_type(InventoryType.WAREHOUSE)
-    
+
+
+@pytest.fixture
+def sample_inventory(warehouse_type):
     inv = Inventory()
     laptop = Item(name="Laptop", quantity=5, price=80000, sku="LAP001")
     mouse = Item(name="Mouse", quantity=10, price=500, sku="MSE001")
@@ -78,6 +83,94 @@ def test_item_not_found(sample_inventory):
         sample_inventory.update_quantity("Keyboard", 2)
 
 
+def test_item_from_row_matches_constructor(warehouse_type):
+    row = {'id': 'abc12345', 'created_at': '2025-01-01T10:00:00',
+           'updated_at': '2025-01-02T10:00:00', 'name': 'Cable',
+           'quantity': '3', 'price': 2.5}
+    fast = Item.from_row(dict(row))
+    slow = Item(**dict(row))
+    assert fast.id == slow.id
+    assert fast.data == slow.data
+    assert fast.created_at == slow.created_at
+    assert fast.updated_at == slow.updated_at
+
+
+def test_bulk_add(warehouse_type):
+    inv = Inventory()
+    items = [Item(name=f"Part {i}", quantity=i, price=1) for i in range(5)]
+    assert inv.bulk_add(items) == 5
+    assert len(inv) == 5
+
+
+def test_search_matches_substrings(sample_inventory):
+    assert [item.data["name"] for item in sample_inventory.search_items("apt")] == ["Laptop"]
+    assert [item.data["name"] for item in sample_inventory.search_items("mse0")] == ["Mouse"]
+    assert len(sample_inventory.search_items("0")) == 2
+    assert sample_inventory.search_items("keyboard") == []
+
+
+def test_search_index_follows_updates(sample_inventory):
+    mouse = sample_inventory.search_items("Mouse")[0]
+    sample_inventory.update_item(mouse.id, {"name": "Trackball"})
+    assert sample_inventory.search_items("mouse") == []
+    assert sample_inventory.search_items("track")[0].id == mouse.id
+    
+    sample_inventory.remove_item(mouse.id)
+    assert sample_inventory.search_items("track") == []
+
+
+def test_row_loader_fills_missing_required_fields(warehouse_type):
+    load = Item.row_loader()
+    item = load({'id': 'r1', 'created_at': '2025-01-01T00:00:00', 'name': 'Widget'})
+    assert item.id == 'r1'
+    assert item.name == 'Widget'
+    assert item.created_at.year == 2025
+
+
+def test_to_row_matches_to_dict(warehouse_type):
+    item = Item(name="Laptop", quantity=5, price=800.5)
+    item_id, created_at, updated_at, data = item.to_row()
+    assert (item_id, created_at, updated_at) == (item.id, item.created_at.isoformat(), item.updated_at.isoformat())
+    assert json.loads(data) == item.to_dict()
+
+
+def test_search_cache_cleared_on_changes(warehouse_type):
+    inv = Inventory()
+    laptop = Item(name="Laptop", quantity=1, price=1.0)
+    inv.add_item(laptop)
+    assert inv.search_items("lap") == [laptop]
+    inv.add_item(Item(name="Lapdesk", quantity=1, price=1.0))
+    assert len(inv.search_items("lap")) == 2
+    inv.remove_item(laptop.id)
+    assert [i.name for i in inv.search_items("LAP")] == ["Lapdesk"]
+
+
+def test_get_all_items_reuses_snapshot(warehouse_type):
+    inv = Inventory()
+    inv.add_item(Item(name="Laptop", quantity=1, price=1.0))
+    first = inv.get_all_items()
+    assert inv.get_all_items() is first
+    inv.add_item(Item(name="Mouse", quantity=1, price=1.0))
+    assert [i.name for i in inv.get_all_items()] == ["Laptop", "Mouse"]
+
+
+def test_version_bumped_on_changes(warehouse_type):
+    inv = Inventory()
+    laptop = Item(name="Laptop", quantity=1, price=1.0)
+    versions = [inv.version]
+    inv.add_item(laptop)
+    versions.append(inv.version)
+    inv.bulk_add([Item(name="Mouse", quantity=1, price=1.0)])
+    versions.append(inv.version)
+    inv.update_item(laptop.id, {"quantity": 2})
+    versions.append(inv.version)
+    inv.remove_item(laptop.id)
+    versions.append(inv.version)
+    assert versions == sorted(set(versions))
+    inv.remove_item(laptop.id)  # nothing to remove
+    assert inv.version == versions[-1]
+
+
 """
 ⚙️ How this works
 